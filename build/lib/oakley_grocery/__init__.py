@@ -1,3 +0,0 @@
-"""Oakley Grocery — smart shopping list manager with Woolworths & Dan Murphy's integration."""
-
-__version__ = "1.1.0"
@@ -1,14 +0,0 @@
-from .config import Config
-from .cache import FileCache
-from .rate_limiter import RateLimiter
-from .formatting import (
-    format_section_header,
-    truncate_for_telegram,
-    now_aest,
-    format_datetime_aest,
-    format_list_item,
-    format_price,
-    format_price_change,
-    format_shopping_list,
-    format_danmurphys_price,
-)
@@ -2,62 +2,166 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import threading
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback
+    orjson = None
+
 from oakley_grocery.common.config import Config
 
+# The parsed config is cached keyed on the file's stat, so every reader
+# pays one stat() syscall and external edits to config.json are still
+# picked up. The lock keeps readers/writers safe across the requests
+# session threads.
+_config_lock = threading.Lock()
+_last_saved_hash: Optional[bytes] = None
+
+# Below one page the mmap setup syscalls outweigh the saved copy
+_MMAP_MIN_SIZE = 4096
+
+
+def _parse_config_file(size: int) -> dict:
+    """Parse config.json, memory-mapping larger files to skip a kernel→user copy."""
+    if size >= _MMAP_MIN_SIZE:
+        with open(Config.config_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is not None:
+                    mv = memoryview(mm)
+                    try:
+                        return orjson.loads(mv)
+                    finally:
+                        mv.release()
+                return json.loads(mm[:])
+    if orjson is not None:
+        return orjson.loads(Config.config_path.read_bytes())
+    return json.loads(Config.config_path.read_text())
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(mtime_ns: int, size: int) -> dict:
+    return _parse_config_file(size)
+
 
 def _load_config() -> dict:
-    """Load config from disk."""
+    """Load config from disk, reusing the cached parse if the file is unchanged."""
     Config.ensure_dirs()
-    if not Config.config_path.exists():
-        return {}
-    try:
-        return json.loads(Config.config_path.read_text())
-    except (json.JSONDecodeError, OSError):
-        return {}
+    with _config_lock:
+        try:
+            st = Config.config_path.stat()
+        except OSError:
+            return {}
+        try:
+            return _load_config_cached(st.st_mtime_ns, st.st_size)
+        except (ValueError, OSError):
+            return {}
+
+
+def _serialize_config(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
 
 
 def _save_config(data: dict) -> None:
-    """Write config to disk."""
+    """Atomically write config to disk and refresh the in-process cache.
+
+    Writes go to a temp file in the same directory followed by os.replace,
+    so a crash mid-write never leaves a torn config.json. Saves where the
+    serialized payload matches the last write are skipped entirely.
+    """
+    global _last_saved_hash
     Config.ensure_dirs()
-    Config.config_path.write_text(json.dumps(data, indent=2))
+    with _config_lock:
+        payload = _serialize_config(data)
+        digest = hashlib.blake2b(payload).digest()
+        if digest == _last_saved_hash and Config.config_path.exists():
+            return
+
+        tmp_path = str(Config.config_path) + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, str(Config.config_path))
+
+        _last_saved_hash = digest
+        _load_config_cached.cache_clear()
+
+
+# ─── Credentials singleton ───────────────────────────────────────────────────
+
+class Credentials:
+    """In-memory credential store backed by config.json.
+
+    Parses the config once on first use and answers all lookups from memory;
+    disk is only touched on save().
+    """
+
+    __slots__ = ("api_key", "cookies")
+
+    _instance: Optional["Credentials"] = None
+
+    def __init__(self) -> None:
+        config = _load_config()
+        self.api_key: Optional[str] = config.get("woolworths_api_key") or None
+        self.cookies: Optional[str] = config.get("woolworths_cookies") or None
+
+    @classmethod
+    def instance(cls) -> "Credentials":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def save(self) -> None:
+        """Persist current credentials, preserving unrelated config keys."""
+        config = _load_config()
+        if self.api_key is not None:
+            config["woolworths_api_key"] = self.api_key
+        if self.cookies is not None:
+            config["woolworths_cookies"] = self.cookies
+        _save_config(config)
 
 
 # ─── Woolworths API Key ──────────────────────────────────────────────────────
 
 def save_woolworths_key(api_key: str) -> None:
     """Save Woolworths API key."""
-    config = _load_config()
-    config["woolworths_api_key"] = api_key
-    _save_config(config)
+    creds = Credentials.instance()
+    creds.api_key = api_key
+    creds.save()
 
 
 def get_woolworths_key() -> Optional[str]:
     """Return Woolworths API key or None."""
-    config = _load_config()
-    return config.get("woolworths_api_key") or None
+    return Credentials.instance().api_key
 
 
 def has_woolworths_key() -> bool:
-    return get_woolworths_key() is not None
+    return Credentials.instance().api_key is not None
 
 
 # ─── Woolworths Cookies (for trolley/cart operations) ────────────────────────
 
 def save_woolworths_cookies(cookies: str) -> None:
     """Save Woolworths browser cookies for cart operations."""
-    config = _load_config()
-    config["woolworths_cookies"] = cookies
-    _save_config(config)
+    creds = Credentials.instance()
+    creds.cookies = cookies
+    creds.save()
 
 
 def get_woolworths_cookies() -> Optional[str]:
     """Return Woolworths cookies string or None."""
-    config = _load_config()
-    return config.get("woolworths_cookies") or None
+    return Credentials.instance().cookies
 
 
 def has_woolworths_cookies() -> bool:
-    return get_woolworths_cookies() is not None
+    return Credentials.instance().cookies is not None
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import math
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from oakley_grocery import db, woolworths
+from oakley_grocery.common.config import Config
 from oakley_grocery.common.formatting import format_price
 
 
@@ -48,15 +51,22 @@ def build_cart(list_id: int, confirm: bool = False) -> dict:
 
     total = sum((i.get("price") or 0) * i.get("quantity", 1) for i in resolved)
 
-    cart_items = []
+    # Aggregate duplicate stockcodes into one entry — one trolley call with
+    # the summed quantity instead of one round-trip per occurrence
+    agg: dict[int, dict] = {}
     for item in resolved:
-        cart_items.append({
-            "generic_name": item["generic_name"],
-            "stockcode": item["stockcode"],
-            "product_name": item.get("product_name", item["generic_name"]),
-            "quantity": item.get("quantity", 1),
-            "price": item.get("price"),
-        })
+        entry = agg.get(item["stockcode"])
+        if entry is None:
+            agg[item["stockcode"]] = {
+                "generic_name": item["generic_name"],
+                "stockcode": item["stockcode"],
+                "product_name": item.get("product_name", item["generic_name"]),
+                "quantity": item.get("quantity", 1),
+                "price": item.get("price"),
+            }
+        else:
+            entry["quantity"] += item.get("quantity", 1)
+    cart_items = list(agg.values())
 
     if not confirm:
         return {
@@ -78,19 +88,29 @@ def build_cart(list_id: int, confirm: bool = False) -> dict:
             "message": f"Woolworths session invalid: {session.get('error', 'unknown')}. Update cookies with: oakley-grocery setup --woolworths-cookies COOKIES",
         }
 
-    # Add items to trolley
+    # Add items to trolley — the calls are independent, so dispatch them
+    # concurrently; add_to_trolley still acquires the shared rate limiter,
+    # which keeps the global requests/sec cap intact across workers.
     added = 0
     failed = []
-    for item in cart_items:
-        try:
-            woolworths.add_to_trolley(item["stockcode"], item["quantity"])
-            added += 1
-        except RuntimeError as e:
-            failed.append({
-                "generic_name": item["generic_name"],
-                "stockcode": item["stockcode"],
-                "error": str(e),
-            })
+    with ThreadPoolExecutor(
+            max_workers=min(8, Config.woolworths_rate_limit_calls)) as pool:
+        futures = {
+            pool.submit(woolworths.add_to_trolley,
+                        item["stockcode"], item["quantity"]): item
+            for item in cart_items
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                future.result()
+                added += 1
+            except RuntimeError as e:
+                failed.append({
+                    "generic_name": item["generic_name"],
+                    "stockcode": item["stockcode"],
+                    "error": str(e),
+                })
 
     return {
         "success": True,
@@ -120,23 +140,23 @@ def get_cart_status() -> dict:
     except RuntimeError as e:
         return {"success": False, "items": [], "total": 0, "message": str(e)}
 
-    items = []
-    total = 0.0
-
     trolley_items = data.get("TrolleyItems", data.get("Items", []))
+    items = []
     for ti in trolley_items:
-        price = ti.get("SalePrice", ti.get("Price", 0))
-        qty = ti.get("Quantity", 1)
-        item_total = price * qty
-        total += item_total
-
+        get = ti.get  # bound once per item
+        # Key-presence fallbacks: a present-but-zero SalePrice (markdown
+        # to $0) must not fall through to the full Price
+        qty = get("Quantity", 1)
+        price = get("SalePrice", get("Price", 0))
         items.append({
-            "stockcode": ti.get("Stockcode"),
-            "name": ti.get("DisplayName", ti.get("Name", "Unknown")),
+            "stockcode": get("Stockcode"),
+            "name": get("DisplayName", get("Name", "Unknown")),
             "quantity": qty,
             "price": price,
-            "total": item_total,
+            "total": price * qty,
         })
+    # fsum keeps the total exact even when many small prices accumulate
+    total = math.fsum(item["total"] for item in items)
 
     return {
         "success": True,
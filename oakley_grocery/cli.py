@@ -1,14 +1,29 @@
 """Unified CLI dispatcher for all oakley-grocery commands."""
 
 import argparse
+import functools
+import io
+import json
 import sys
 
+from oakley_grocery.common.lazy_import import LazyLoader
+
+# Heavyweight modules resolve on first use — a command only pays for the
+# imports it actually touches
+auth = LazyLoader("auth", globals(), "oakley_grocery.auth")
+cart = LazyLoader("cart", globals(), "oakley_grocery.cart")
+common = LazyLoader("common", globals(), "oakley_grocery.common")
+danmurphys = LazyLoader("danmurphys", globals(), "oakley_grocery.danmurphys")
+db = LazyLoader("db", globals(), "oakley_grocery.db")
+lists = LazyLoader("lists", globals(), "oakley_grocery.lists")
+memory = LazyLoader("memory", globals(), "oakley_grocery.memory")
+resolver = LazyLoader("resolver", globals(), "oakley_grocery.resolver")
+woolworths = LazyLoader("woolworths", globals(), "oakley_grocery.woolworths")
+
 
 # ─── Phase 1: Setup & Status ────────────────────────────────────────────────
 
 def cmd_setup(args):
-    from oakley_grocery import auth
-
     if not args.woolworths_key and not args.woolworths_cookies:
         print("Error: Provide --woolworths-key and/or --woolworths-cookies.", file=sys.stderr)
         sys.exit(1)
@@ -17,8 +32,7 @@ def cmd_setup(args):
         auth.save_woolworths_key(args.woolworths_key)
         print("Woolworths API key saved.")
 
-        from oakley_grocery.woolworths import test_connection
-        result = test_connection()
+        result = woolworths.test_connection()
         if result["connected"]:
             print("Woolworths API: OK")
         else:
@@ -28,8 +42,7 @@ def cmd_setup(args):
         auth.save_woolworths_cookies(args.woolworths_cookies)
         print("Woolworths cookies saved.")
 
-        from oakley_grocery.woolworths import validate_session
-        result = validate_session()
+        result = woolworths.validate_session()
         if result["valid"]:
             print("Woolworths session: OK")
         else:
@@ -37,27 +50,48 @@ def cmd_setup(args):
 
 
 def cmd_status(args):
-    from oakley_grocery import __version__, auth, db
-    from oakley_grocery.common import Config, format_datetime_aest
+    from concurrent.futures import ThreadPoolExecutor
 
-    Config.ensure_dirs()
+    from oakley_grocery import __version__
+
+    common.Config.ensure_dirs()
+
+    # Kick the network probe off first (opt-in — it costs a full round-trip)
+    # so it overlaps the local DB counts below
+    probe = None
+    if args.check_api and auth.has_woolworths_key():
+        pool = ThreadPoolExecutor(max_workers=1)
+        probe = pool.submit(woolworths.test_connection)
+        pool.shutdown(wait=False)
 
     lines = [
         f"Oakley Grocery v{__version__}",
-        f"Time: {format_datetime_aest()}",
+        f"Time: {common.format_datetime_aest()}",
         "",
     ]
 
+    # DB stats — gathered before joining the probe so the two overlap
+    try:
+        db_lines = [
+            "",
+            f"Preferences: {db.count_preferences()}",
+            f"Active lists: {db.count_lists('active')}",
+            f"Orders: {db.count_orders()}",
+        ]
+    except Exception:
+        db_lines = ["", "Database: not initialized"]
+
     # Woolworths API
-    if auth.has_woolworths_key():
-        from oakley_grocery.woolworths import test_connection
-        result = test_connection()
+    if not auth.has_woolworths_key():
+        lines.append("Woolworths API: not configured (search still works)")
+    elif probe is None:
+        lines.append("Woolworths API: (skipped, use --check-api)")
+    else:
+        result = probe.result()
         if result["connected"]:
             lines.append("Woolworths API: connected")
         else:
             lines.append(f"Woolworths API: DISCONNECTED — {result['error']}")
-    else:
-        lines.append("Woolworths API: not configured (search still works)")
 
     # Woolworths cookies
     if auth.has_woolworths_cookies():
@@ -65,23 +99,61 @@ def cmd_status(args):
     else:
         lines.append("Woolworths cart: not configured (optional — for cart building)")
 
-    # DB stats
-    try:
-        prefs = db.count_preferences()
-        active_lists = db.count_lists("active")
-        total_orders = db.count_orders()
-        lines.append("")
-        lines.append(f"Preferences: {prefs}")
-        lines.append(f"Active lists: {active_lists}")
-        lines.append(f"Orders: {total_orders}")
-    except Exception:
-        lines.append("")
-        lines.append("Database: not initialized")
+    lines.extend(db_lines)
 
     lines.append("")
-    lines.append(f"Data directory: {Config.data_dir}")
+    lines.append(f"Data directory: {common.Config.data_dir}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+class _BoundedFull(Exception):
+    """Raised by a bounded buffer's writer once truncation is inevitable."""
 
-    print("\n".join(lines))
+
+# Formatting past the Telegram cutoff is wasted work; the margin leaves
+# truncate_for_telegram a clean newline to cut at
+_TRUNCATE_MARGIN = 256
+
+_STATUS_BADGE = {
+    "active": "",
+    "purchased": " [PURCHASED]",
+    "archived": " [ARCHIVED]",
+}
+
+
+def _bounded_buffer():
+    """Return (buf, write) where write raises _BoundedFull past the cutoff."""
+    buf = io.StringIO()
+    limit = common.Config.telegram_max_length + _TRUNCATE_MARGIN
+
+    def write(text):
+        if buf.write(text) and buf.tell() > limit:
+            raise _BoundedFull
+    return buf, write
+
+
+def _flush(buf):
+    """Write a buffer built line-by-line in one stdout call (output
+    identical to print("\n".join(lines)))."""
+    sys.stdout.write(common.truncate_for_telegram(buf.getvalue()[:-1]) + "\n")
+
+
+def _emit(lines):
+    """Join and write a lines list in one stdout call."""
+    sys.stdout.write(common.truncate_for_telegram("\n".join(lines)) + "\n")
+
+
+def _emit_json(payload):
+    """--json output path — raw data, no format helpers, no truncation."""
+    print(json.dumps(payload, default=str))
+
+
+def _parse_csv(s):
+    """Split a comma-separated argument into stripped, non-empty tokens."""
+    if not s:
+        return []
+    return [t for t in (p.strip() for p in s.split(",")) if t]
 
 
 # ─── Phase 1: Search ────────────────────────────────────────────────────────
@@ -94,9 +166,6 @@ def cmd_search(args):
 
 
 def _cmd_search_woolworths(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import woolworths
-
     try:
         products = woolworths.search_products(
             query=args.query,
@@ -110,48 +179,40 @@ def _cmd_search_woolworths(args):
     if args.specials_only:
         products = [p for p in products if p.get("on_special")]
 
+    if args.json:
+        _emit_json(products)
+        return
+
     if not products:
         print("No products found.")
         return
 
-    lines = [format_section_header(f"Woolworths Search: '{args.query}' ({len(products)} results)"), ""]
-
-    for i, p in enumerate(products, 1):
-        name = p.get("name", "Unknown")
-        brand = p.get("brand", "")
-        price = format_price(p.get("price"))
-        size = p.get("package_size", "")
-        cup = p.get("cup_string", "")
-
-        line = f"{i}. {name}"
-        if brand:
-            line += f" ({brand})"
-        lines.append(line)
-
-        details = f"   {price}"
-        if size:
-            details += f" | {size}"
-        if cup:
-            details += f" | {cup}"
-
-        if p.get("on_special"):
-            was = format_price(p.get("was_price"))
-            details += f" | SPECIAL (was {was})"
-
-        if not p.get("available", True):
-            details += " | UNAVAILABLE"
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"Woolworths Search: '{args.query}' ({len(products)} results)"))
+    w("\n\n")
 
-        lines.append(details)
-        lines.append(f"   Code: {p.get('stockcode', 'N/A')}")
-        lines.append("")
-
-    print(truncate_for_telegram("\n".join(lines)))
+    try:
+        for i, p in enumerate(products, 1):
+            name = p.get("name", "Unknown")
+            brand = p.get("brand", "")
+            price = common.format_price(p.get("price"))
+            size = p.get("package_size", "")
+            cup = p.get("cup_string", "")
+            special = (f" | SPECIAL (was {common.format_price(p.get('was_price'))})"
+                       if p.get("on_special") else "")
+
+            # One f-string per row instead of a chain of += reallocations
+            w(f"{i}. {name}{f' ({brand})' if brand else ''}\n"
+              f"   {price}{f' | {size}' if size else ''}{f' | {cup}' if cup else ''}"
+              f"{special}{'' if p.get('available', True) else ' | UNAVAILABLE'}\n"
+              f"   Code: {p.get('stockcode', 'N/A')}\n\n")
+    except _BoundedFull:
+        pass
+
+    _flush(buf)
 
 
 def _cmd_search_danmurphys(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price, format_danmurphys_price
-    from oakley_grocery import danmurphys
-
     try:
         products = danmurphys.search_products(
             query=args.query,
@@ -165,75 +226,79 @@ def _cmd_search_danmurphys(args):
     if args.specials_only:
         products = [p for p in products if p.get("on_special")]
 
+    if args.json:
+        _emit_json(products)
+        return
+
     if not products:
         print("No products found.")
         return
 
-    lines = [format_section_header(f"Dan Murphy's: '{args.query}' ({len(products)} results)"), ""]
-
-    for i, p in enumerate(products, 1):
-        name = p.get("name", "Unknown")
-        brand = p.get("brand", "")
-        volume = p.get("volume", "")
-
-        line = f"{i}. {name}"
-        if brand:
-            line += f" ({brand})"
-        lines.append(line)
-
-        # Multi-tier pricing
-        pricing = format_danmurphys_price(p)
-        details = f"   {pricing}"
-
-        if volume:
-            details += f" | {volume}"
-
-        if p.get("on_special"):
-            was = format_price(p.get("was_price"))
-            saved = p.get("amount_saved")
-            special_text = " | SPECIAL"
-            if was:
-                special_text += f" (was {was})"
-            if saved and saved > 0:
-                special_text += f" save ${saved:.2f}"
-            details += special_text
-
-        if p.get("is_member_offer"):
-            details += " | MEMBER OFFER"
-
-        lines.append(details)
-
-        # Alcohol-specific details
-        extras = []
-        if p.get("varietal"):
-            extras.append(p["varietal"])
-        if p.get("region"):
-            extras.append(p["region"])
-        if p.get("alcohol_pct"):
-            extras.append(f"{p['alcohol_pct']} ABV")
-        if p.get("rating"):
-            extras.append(f"Rating: {p['rating']}")
-
-        if extras:
-            lines.append(f"   {' | '.join(extras)}")
-
-        lines.append(f"   Code: {p.get('stockcode', 'N/A')}")
-        lines.append("")
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"Dan Murphy's: '{args.query}' ({len(products)} results)"))
+    w("\n\n")
+
+    try:
+        for i, p in enumerate(products, 1):
+            name = p.get("name", "Unknown")
+            brand = p.get("brand", "")
+            volume = p.get("volume", "")
+
+            line = f"{i}. {name}"
+            if brand:
+                line += f" ({brand})"
+            w(f"{line}\n")
+
+            # Multi-tier pricing
+            pricing = common.format_danmurphys_price(p)
+            details = f"   {pricing}"
+
+            if volume:
+                details += f" | {volume}"
+
+            if p.get("on_special"):
+                was = common.format_price(p.get("was_price"))
+                saved = p.get("amount_saved")
+                special_text = " | SPECIAL"
+                if was:
+                    special_text += f" (was {was})"
+                if saved and saved > 0:
+                    special_text += f" save ${saved:.2f}"
+                details += special_text
+
+            if p.get("is_member_offer"):
+                details += " | MEMBER OFFER"
+
+            w(f"{details}\n")
+
+            # Alcohol-specific details
+            extras = []
+            if p.get("varietal"):
+                extras.append(p["varietal"])
+            if p.get("region"):
+                extras.append(p["region"])
+            if p.get("alcohol_pct"):
+                extras.append(f"{p['alcohol_pct']} ABV")
+            if p.get("rating"):
+                extras.append(f"Rating: {p['rating']}")
+
+            if extras:
+                w(f"   {' | '.join(extras)}\n")
+
+            w(f"   Code: {p.get('stockcode', 'N/A')}\n\n")
+    except _BoundedFull:
+        pass
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _flush(buf)
 
 
 # ─── Phase 2: Resolve ───────────────────────────────────────────────────────
 
 def cmd_resolve(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import resolver
-
     if args.stockcode:
         # Direct preference save
-        from oakley_grocery import woolworths
         try:
-            product = woolworths.get_product_details(args.stockcode)
+            product = _product_details(args.stockcode)
         except RuntimeError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -250,7 +315,10 @@ def cmd_resolve(args):
             package_size=product.get("package_size"),
             price=product.get("price"),
         )
-        print(f"Saved: '{args.item}' -> {product.get('name', 'Unknown')} ({format_price(product.get('price'))})")
+        if args.json:
+            _emit_json({"saved": True, "generic_name": args.item, "product": product})
+            return
+        print(f"Saved: '{args.item}' -> {product.get('name', 'Unknown')} ({common.format_price(product.get('price'))})")
         return
 
     result = resolver.resolve_item(
@@ -259,13 +327,17 @@ def cmd_resolve(args):
         prefer_size=args.size,
     )
 
+    if args.json:
+        _emit_json(result)
+        return
+
     if result["resolved"] and result["product"]:
         p = result["product"]
         lines = [
-            format_section_header(f"Resolved: {args.item}"),
+            common.format_section_header(f"Resolved: {args.item}"),
             "",
             f"Product: {p.get('name', 'Unknown')}",
-            f"Price: {format_price(p.get('price'))}",
+            f"Price: {common.format_price(p.get('price'))}",
             f"Source: {result['source']}",
         ]
         if p.get("brand"):
@@ -274,17 +346,20 @@ def cmd_resolve(args):
             lines.append(f"Size: {p['package_size']}")
         lines.append(f"Code: {p.get('stockcode', 'N/A')}")
 
-        print(truncate_for_telegram("\n".join(lines)))
+        _emit(lines)
     elif result["candidates"]:
         lines = [
-            format_section_header(f"Disambiguation needed: {args.item}"),
+            common.format_section_header(f"Disambiguation needed: {args.item}"),
             "",
             "Pick one and run: oakley-grocery resolve --item ITEM --stockcode CODE",
             "",
         ]
-        for i, c in enumerate(result["candidates"], 1):
+        # Best match first regardless of which resolver path produced them
+        candidates = sorted(result["candidates"],
+                            key=lambda c: c.get("_score", 0), reverse=True)
+        for i, c in enumerate(candidates, 1):
             name = c.get("name", "Unknown")
-            price = format_price(c.get("price"))
+            price = common.format_price(c.get("price"))
             brand = c.get("brand", "")
             size = c.get("package_size", "")
             score = c.get("_score", 0)
@@ -297,7 +372,7 @@ def cmd_resolve(args):
             lines.append(f"   Code: {c.get('stockcode', 'N/A')}")
             lines.append("")
 
-        print(truncate_for_telegram("\n".join(lines)))
+        _emit(lines)
     else:
         print(f"Could not resolve '{args.item}'. Try searching: oakley-grocery search --query \"{args.item}\"")
 
@@ -305,58 +380,52 @@ def cmd_resolve(args):
 # ─── Phase 2: List Commands ─────────────────────────────────────────────────
 
 def cmd_list_create(args):
-    from oakley_grocery import lists
-
-    items = None
-    if args.items:
-        items = [i.strip() for i in args.items.split(",") if i.strip()]
+    items = _parse_csv(args.items) or None
 
     result = lists.create_list(args.name, items)
     print(f"Created list #{result['list_id']}: {result['name']} ({result['item_count']} items)")
 
 
 def cmd_list_show(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price, format_shopping_list
-    from oakley_grocery import lists
-
     try:
         data = lists.get_list(args.list_id, resolve=args.resolve)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if args.json:
+        _emit_json(data)
+        return
+
     lst = data["list"]
     items = data["items"]
     stats = data["stats"]
 
-    lines = [
-        format_section_header(f"List #{lst['id']}: {lst['name']}"),
-        f"Status: {lst['status']} | Items: {stats['total']}",
-        f"Resolved: {stats['resolved']}/{stats['total']}",
-        "",
-    ]
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"List #{lst['id']}: {lst['name']}"))
+    w(f"\nStatus: {lst['status']} | Items: {stats['total']}\n")
+    w(f"Resolved: {stats['resolved']}/{stats['total']}\n\n")
 
     if items:
-        lines.append(format_shopping_list(items))
+        w(f"{common.format_shopping_list(items)}\n")
     else:
-        lines.append("(empty)")
+        w("(empty)\n")
 
     # Show disambiguation needed
     if stats.get("disambiguation_needed"):
-        lines.append("")
-        lines.append(format_section_header("Needs your pick:"))
+        w("\n")
+        w(common.format_section_header("Needs your pick:"))
+        w("\n")
         for d in stats["disambiguation_needed"]:
-            lines.append(f"  {d['item']}:")
+            w(f"  {d['item']}:\n")
             for c in d["candidates"]:
-                lines.append(f"    - {c['name']} ({format_price(c.get('price'))}) Code: {c['stockcode']}")
+                w(f"    - {c['name']} ({common.format_price(c.get('price'))}) Code: {c['stockcode']}\n")
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _flush(buf)
 
 
 def cmd_list_add(args):
-    from oakley_grocery import lists
-
-    items = [i.strip() for i in args.items.split(",") if i.strip()]
+    items = _parse_csv(args.items)
     try:
         result = lists.add_items(args.list_id, items)
     except ValueError as e:
@@ -367,9 +436,7 @@ def cmd_list_add(args):
 
 
 def cmd_list_remove(args):
-    from oakley_grocery import lists
-
-    items = [i.strip() for i in args.items.split(",") if i.strip()]
+    items = _parse_csv(args.items)
     try:
         result = lists.remove_items(args.list_id, items)
     except ValueError as e:
@@ -383,42 +450,33 @@ def cmd_list_remove(args):
 
 
 def cmd_lists(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header
-    from oakley_grocery import db
+    all_lists = db.get_list_summaries(status=args.status)
 
-    all_lists = db.get_lists(status=args.status)
+    if args.json:
+        _emit_json(all_lists)
+        return
 
     if not all_lists:
         print("No lists found.")
         return
 
     label = args.status or "All"
-    lines = [format_section_header(f"Shopping Lists — {label} ({len(all_lists)})"), ""]
+    lines = [common.format_section_header(f"Shopping Lists — {label} ({len(all_lists)})"), ""]
 
     for lst in all_lists:
-        items = db.get_list_items(lst["id"])
-        resolved = sum(1 for i in items if i["resolved"])
-        total = sum((i.get("price") or 0) * i.get("quantity", 1) for i in items if i.get("price"))
-
-        status_badge = {
-            "active": "",
-            "purchased": " [PURCHASED]",
-            "archived": " [ARCHIVED]",
-        }.get(lst["status"], f" [{lst['status'].upper()}]")
+        status_badge = _STATUS_BADGE.get(lst["status"], f" [{lst['status'].upper()}]")
 
         lines.append(f"#{lst['id']}: {lst['name']}{status_badge}")
-        lines.append(f"  {len(items)} items ({resolved} resolved)")
-        if total > 0:
-            lines.append(f"  Est: ${total:.2f}")
+        lines.append(f"  {lst['item_count']} items ({lst['resolved_count']} resolved)")
+        if lst["est_total"] > 0:
+            lines.append(f"  Est: ${lst['est_total']:.2f}")
         lines.append(f"  Created: {lst['created_at']}")
         lines.append("")
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _emit(lines)
 
 
 def cmd_list_clear(args):
-    from oakley_grocery import db
-
     if not args.confirm:
         lst = db.get_list(args.list_id)
         if lst:
@@ -438,9 +496,6 @@ def cmd_list_clear(args):
 # ─── Phase 3: Cart & Checkout ───────────────────────────────────────────────
 
 def cmd_cart_build(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import cart
-
     result = cart.build_cart(args.list_id, confirm=args.confirm)
 
     if not result.get("success"):
@@ -449,14 +504,14 @@ def cmd_cart_build(args):
 
     if result.get("preview"):
         lines = [
-            format_section_header("Cart Preview"),
+            common.format_section_header("Cart Preview"),
             "",
         ]
         for item in result["items"]:
             qty = item.get("quantity", 1)
             name = item.get("product_name", item["generic_name"])
             price = item.get("price")
-            lines.append(f"  {qty}x {name} ({format_price(price)})")
+            lines.append(f"  {qty}x {name} ({common.format_price(price)})")
 
         if result.get("unresolved"):
             lines.append("")
@@ -466,7 +521,7 @@ def cmd_cart_build(args):
         lines.append(result["message"])
     else:
         lines = [
-            format_section_header("Cart Built"),
+            common.format_section_header("Cart Built"),
             "",
             result["message"],
         ]
@@ -476,36 +531,37 @@ def cmd_cart_build(args):
             for f in result["failed"]:
                 lines.append(f"  {f['generic_name']}: {f['error']}")
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _emit(lines)
 
 
 def cmd_cart_status(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import cart
-
     result = cart.get_cart_status()
 
     if not result.get("success"):
         print(f"Error: {result.get('message', 'unknown error')}", file=sys.stderr)
         sys.exit(1)
 
+    if args.json:
+        _emit_json(result)
+        return
+
     if not result["items"]:
         print("Trolley is empty.")
         return
 
-    lines = [format_section_header(f"Woolworths Trolley ({len(result['items'])} items)"), ""]
+    lines = [common.format_section_header(f"Woolworths Trolley ({len(result['items'])} items)"), ""]
 
     for item in result["items"]:
         qty = item.get("quantity", 1)
         name = item.get("name", "Unknown")
-        price = format_price(item.get("price"))
-        total = format_price(item.get("total"))
+        price = common.format_price(item.get("price"))
+        total = common.format_price(item.get("total"))
         lines.append(f"  {qty}x {name} ({price} ea, {total})")
 
     lines.append("")
-    lines.append(f"Total: {format_price(result['total'])}")
+    lines.append(f"Total: {common.format_price(result['total'])}")
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _emit(lines)
 
 
 def cmd_checkout(args):
@@ -521,13 +577,10 @@ def cmd_checkout(args):
 
 
 def cmd_complete(args):
-    from oakley_grocery.common import format_price
-    from oakley_grocery import lists
-
     if not args.confirm:
         print(f"Will mark list #{args.list_id} as purchased.")
         if args.total_paid:
-            print(f"Total paid: {format_price(args.total_paid)}")
+            print(f"Total paid: {common.format_price(args.total_paid)}")
         print("Add --confirm to proceed.")
         return
 
@@ -543,18 +596,13 @@ def cmd_complete(args):
 
     print(f"Order logged (#{result['order_id']}). {result['items_logged']} items recorded.")
     if args.total_paid:
-        print(f"Total paid: {format_price(args.total_paid)}")
+        print(f"Total paid: {common.format_price(args.total_paid)}")
 
 
 # ─── Phase 4: Intelligence ──────────────────────────────────────────────────
 
 def cmd_usual(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import memory, lists
-
-    exclude = None
-    if args.exclude:
-        exclude = [e.strip() for e in args.exclude.split(",") if e.strip()]
+    exclude = _parse_csv(args.exclude) or None
 
     items = memory.build_usual(
         min_frequency=args.min_frequency,
@@ -562,44 +610,80 @@ def cmd_usual(args):
         exclude=exclude,
     )
 
+    if args.json and not args.create_list:
+        _emit_json(items)
+        return
+
     if not items:
         print("Not enough order history to build 'the usual'. Complete 3+ orders first.")
         return
 
     if args.create_list:
-        from oakley_grocery.common.formatting import now_aest
-        name = f"Weekly Shop {now_aest().strftime('%d %b')}"
+        name = f"Weekly Shop {common.now_aest().strftime('%d %b')}"
         item_strings = [item["generic_name"] for item in items]
         result = lists.create_list(name, item_strings)
+        if args.json:
+            _emit_json(result)
+            return
         print(f"Created list #{result['list_id']}: {name} ({result['item_count']} items)")
         print(f"Run: oakley-grocery list-show --list-id {result['list_id']} --resolve")
         return
 
-    lines = [format_section_header(f"The Usual ({len(items)} items)"), ""]
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"The Usual ({len(items)} items)"))
+    w("\n\n")
 
-    for item in items:
-        name = item.get("generic_name", "?")
-        freq = item.get("frequency", 0)
-        product = item.get("product_name", "")
-        avg = item.get("avg_price")
 
-        line = f"  {name} (in {freq} of last orders)"
-        if product and product != name:
-            line += f" -> {product}"
-        if avg:
-            line += f" ~{format_price(avg)}"
-        lines.append(line)
+    try:
+        for item in items:
+            name = item.get("generic_name", "?")
+            freq = item.get("frequency", 0)
+            product = item.get("product_name", "")
+            avg = item.get("avg_price")
 
-    lines.append("")
-    lines.append("Add --create-list to make a shopping list from these items.")
+            line = f"  {name} (in {freq} of last orders)"
+            if product and product != name:
+                line += f" -> {product}"
+            if avg:
+                line += f" ~{common.format_price(avg)}"
+            w(f"{line}\n")
 
-    print(truncate_for_telegram("\n".join(lines)))
+        w("\nAdd --create-list to make a shopping list from these items.\n")
+    except _BoundedFull:
+        pass
 
+    _flush(buf)
 
-def cmd_specials(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import woolworths, db
 
+@functools.lru_cache(maxsize=512)
+def _product_details(stockcode):
+    """Per-invocation memo over woolworths.get_product_details.
+
+    Commands can ask about the same stockcode more than once (usual +
+    list overlap); repeats answer from memory instead of the cache file.
+    """
+    return woolworths.get_product_details(stockcode)
+
+
+def _fetch_details_parallel(stockcodes, max_workers=8):
+    """Fetch product details for several stockcodes concurrently.
+
+    Returns {stockcode: product}, with None where a lookup failed — the
+    per-item sequential version paid one full round-trip per product.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _one(stockcode):
+        try:
+            return _product_details(stockcode)
+        except RuntimeError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(stockcodes, pool.map(_one, stockcodes)))
+
+
+def cmd_specials(args):
     if args.usual_only:
         # Check specials for usual items
         usual_items = db.get_frequent_items(min_orders=2, lookback=10)
@@ -613,31 +697,35 @@ def cmd_specials(args):
             return
 
         # Search for specials on those products
-        matches = []
-        for item in usual_items:
-            if not item.get("stockcode"):
-                continue
-            try:
-                product = woolworths.get_product_details(item["stockcode"])
-                if product and product.get("on_special"):
-                    matches.append({**product, "generic_name": item["generic_name"]})
-            except RuntimeError:
-                continue
+        wanted = [i for i in usual_items if i.get("stockcode")]
+        details = _fetch_details_parallel([i["stockcode"] for i in wanted])
+        matches = [
+            {**product, "generic_name": item["generic_name"]}
+            for item in wanted
+            if (product := details.get(item["stockcode"])) and product.get("on_special")
+        ]
+
+        if args.json:
+            _emit_json(matches)
+            return
 
         if not matches:
             print("None of your usual items are on special right now.")
             return
 
-        lines = [format_section_header(f"Specials on Your Usual Items ({len(matches)})"), ""]
-        for m in matches:
-            name = m.get("name", m.get("generic_name", "?"))
-            price = format_price(m.get("price"))
-            was = format_price(m.get("was_price"))
-            lines.append(f"  {name}")
-            lines.append(f"    NOW {price} (was {was})")
-            lines.append("")
-
-        print(truncate_for_telegram("\n".join(lines)))
+        buf, w = _bounded_buffer()
+        w(common.format_section_header(f"Specials on Your Usual Items ({len(matches)})"))
+        w("\n\n")
+        try:
+            for m in matches:
+                name = m.get("name", m.get("generic_name", "?"))
+                price = common.format_price(m.get("price"))
+                was = common.format_price(m.get("was_price"))
+                w(f"  {name}\n    NOW {price} (was {was})\n\n")
+        except _BoundedFull:
+            pass
+
+        _flush(buf)
         return
 
     if args.for_list:
@@ -647,31 +735,35 @@ def cmd_specials(args):
             print(f"List {args.for_list} is empty or not found.")
             return
 
-        matches = []
-        for item in items:
-            if not item.get("stockcode"):
-                continue
-            try:
-                product = woolworths.get_product_details(item["stockcode"])
-                if product and product.get("on_special"):
-                    matches.append({**product, "generic_name": item["generic_name"]})
-            except RuntimeError:
-                continue
+        wanted = [i for i in items if i.get("stockcode")]
+        details = _fetch_details_parallel([i["stockcode"] for i in wanted])
+        matches = [
+            {**product, "generic_name": item["generic_name"]}
+            for item in wanted
+            if (product := details.get(item["stockcode"])) and product.get("on_special")
+        ]
+
+        if args.json:
+            _emit_json(matches)
+            return
 
         if not matches:
             print("No items in this list are on special.")
             return
 
-        lines = [format_section_header(f"Specials in List #{args.for_list} ({len(matches)})"), ""]
-        for m in matches:
-            name = m.get("name", m.get("generic_name", "?"))
-            price = format_price(m.get("price"))
-            was = format_price(m.get("was_price"))
-            lines.append(f"  {name}")
-            lines.append(f"    NOW {price} (was {was})")
-            lines.append("")
-
-        print(truncate_for_telegram("\n".join(lines)))
+        buf, w = _bounded_buffer()
+        w(common.format_section_header(f"Specials in List #{args.for_list} ({len(matches)})"))
+        w("\n\n")
+        try:
+            for m in matches:
+                name = m.get("name", m.get("generic_name", "?"))
+                price = common.format_price(m.get("price"))
+                was = common.format_price(m.get("was_price"))
+                w(f"  {name}\n    NOW {price} (was {was})\n\n")
+        except _BoundedFull:
+            pass
+
+        _flush(buf)
         return
 
     # General specials
@@ -681,225 +773,343 @@ def cmd_specials(args):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if args.json:
+        _emit_json(products)
+        return
+
     if not products:
         print("No specials found.")
         return
 
-    lines = [format_section_header(f"Current Specials ({len(products)})"), ""]
-    for i, p in enumerate(products, 1):
-        name = p.get("name", "Unknown")
-        price = format_price(p.get("price"))
-        was = format_price(p.get("was_price"))
-        lines.append(f"{i}. {name}")
-        lines.append(f"   NOW {price} (was {was})")
-        if p.get("cup_string"):
-            lines.append(f"   {p['cup_string']}")
-        lines.append(f"   Code: {p.get('stockcode', 'N/A')}")
-        lines.append("")
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"Current Specials ({len(products)})"))
+    w("\n\n")
+
+    try:
+        for i, p in enumerate(products, 1):
+            name = p.get("name", "Unknown")
+            price = common.format_price(p.get("price"))
+            was = common.format_price(p.get("was_price"))
+            cup = p.get("cup_string", "")
+            cup_line = f"   {cup}\n" if cup else ""
+            w(f"{i}. {name}\n   NOW {price} (was {was})\n"
+              f"{cup_line}   Code: {p.get('stockcode', 'N/A')}\n\n")
+    except _BoundedFull:
+        pass
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _flush(buf)
 
 
 def cmd_prices(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import db
-
     if args.item:
         # Look up preference to get stockcode
         pref = db.get_preference(args.item)
         if pref:
             history = db.get_price_history(stockcode=pref["stockcode"], days=args.days)
+            if args.json:
+                _emit_json(history)
+                return
             if not history:
                 print(f"No price history for '{args.item}'.")
                 return
 
-            lines = [format_section_header(f"Price History: {pref['product_name']}"), ""]
+            lines = [common.format_section_header(f"Price History: {pref['product_name']}"), ""]
             for h in history:
                 special = " *SPECIAL*" if h.get("on_special") else ""
-                lines.append(f"  {h['recorded_at']}: {format_price(h['price'])}{special}")
-            print(truncate_for_telegram("\n".join(lines)))
+                lines.append(f"  {h['recorded_at']}: {common.format_price(h['price'])}{special}")
+            _emit(lines)
         else:
             print(f"No preference saved for '{args.item}'. Resolve it first.")
         return
 
     if args.all:
         history = db.get_price_history(days=args.days, limit=50)
+        if args.json:
+            _emit_json(history)
+            return
         if not history:
             print("No price history recorded yet.")
             return
 
-        lines = [format_section_header(f"Recent Prices (last {args.days} days)"), ""]
+        lines = [common.format_section_header(f"Recent Prices (last {args.days} days)"), ""]
         for h in history:
             special = " *SPECIAL*" if h.get("on_special") else ""
-            lines.append(f"  {h['product_name']}: {format_price(h['price'])}{special} ({h['recorded_at']})")
-        print(truncate_for_telegram("\n".join(lines)))
+            lines.append(f"  {h['product_name']}: {common.format_price(h['price'])}{special} ({h['recorded_at']})")
+        _emit(lines)
         return
 
     print("Specify --item NAME or --all to view price history.")
 
 
 def cmd_history(args):
-    from oakley_grocery.common import truncate_for_telegram, format_section_header, format_price
-    from oakley_grocery import db, memory
-
     orders = db.get_orders(limit=args.limit, days=args.days)
 
+    if args.json:
+        _emit_json(orders)
+        return
+
     if not orders:
         print("No purchase history.")
         return
 
-    lines = [format_section_header(f"Purchase History ({len(orders)} orders)"), ""]
+    buf, w = _bounded_buffer()
+    w(common.format_section_header(f"Purchase History ({len(orders)} orders)"))
+    w("\n\n")
 
-    for order in orders:
-        paid = format_price(order.get("total_paid"))
-        est = format_price(order.get("total_estimate"))
-        items = order.get("item_count", 0)
 
-        lines.append(f"Order #{order['id']} — {order['created_at']}")
-        lines.append(f"  {items} items | Paid: {paid} | Est: {est}")
-        if order.get("notes"):
-            lines.append(f"  Note: {order['notes']}")
-        lines.append("")
+    try:
+        for order in orders:
+            paid = common.format_price(order.get("total_paid"))
+            est = common.format_price(order.get("total_estimate"))
+            items = order.get("item_count", 0)
+
+            w(f"Order #{order['id']} — {order['created_at']}\n")
+            w(f"  {items} items | Paid: {paid} | Est: {est}\n")
+            if order.get("notes"):
+                w(f"  Note: {order['notes']}\n")
+            w("\n")
 
-    # Add spending summary
-    summary = memory.get_spending_summary(period_days=args.days or 30)
-    if summary["order_count"] > 0:
-        lines.append(f"Period total: {format_price(summary['total_spent'])}")
-        lines.append(f"Avg order: {format_price(summary['avg_order'])}")
+        # Add spending summary
+        summary = memory.get_spending_summary(period_days=args.days or 30)
+        if summary["order_count"] > 0:
+            w(f"Period total: {common.format_price(summary['total_spent'])}\n")
+            w(f"Avg order: {common.format_price(summary['avg_order'])}\n")
+    except _BoundedFull:
+        pass
 
-    print(truncate_for_telegram("\n".join(lines)))
+    _flush(buf)
 
 
 # ─── Main dispatcher ────────────────────────────────────────────────────────
+#
+# Subparser construction is the dominant cost of a CLI invocation, so each
+# command registers through its own builder and main() only builds the one
+# the command line actually names. The no-command / help paths still build
+# everything so help output is unchanged.
+
+def _add_setup_parser(subparsers):
+    p = subparsers.add_parser("setup", help="Configure Woolworths credentials")
+    p.add_argument("--woolworths-key", default=None, help="Woolworths API key (optional)")
+    p.add_argument("--woolworths-cookies", default=None, help="Woolworths browser cookies (for cart)")
+
+
+def _add_status_parser(subparsers):
+    p = subparsers.add_parser("status", help="Show version, API status, DB stats")
+    p.add_argument("--check-api", action="store_true",
+                   help="Probe the Woolworths API (network round-trip)")
+
+
+def _add_search_parser(subparsers):
+    p = subparsers.add_parser("search", help="Search products (Woolworths or Dan Murphy's)")
+    p.add_argument("--query", required=True, help="Search text")
+    p.add_argument("--store", default="woolworths",
+                   choices=["woolworths", "dan-murphys"],
+                   help="Store to search (default: woolworths)")
+    p.add_argument("--sort", default=None, help="Sort: TraderRelevance|PriceAsc|PriceDesc (Woolworths) or Relevance|PriceAsc|PriceDesc (Dan Murphy's)")
+    p.add_argument("--specials-only", action="store_true", help="Only show items on special")
+    p.add_argument("--limit", type=int, default=10, help="Max results (default: 10)")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_resolve_parser(subparsers):
+    p = subparsers.add_parser("resolve", help="Resolve an item or save preference")
+    p.add_argument("--item", required=True, help="Generic item name (e.g. 'milk')")
+    p.add_argument("--brand", default=None, help="Preferred brand")
+    p.add_argument("--size", default=None, help="Preferred size")
+    p.add_argument("--stockcode", type=int, default=None, help="Save specific product as preference")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_list_create_parser(subparsers):
+    p = subparsers.add_parser("list-create", help="Create a shopping list")
+    p.add_argument("--name", required=True, help="List name")
+    p.add_argument("--items", default=None, help="Comma-separated items (e.g. 'milk,bread,2 eggs')")
+
+
+def _add_list_show_parser(subparsers):
+    p = subparsers.add_parser("list-show", help="Show a shopping list")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--resolve", action="store_true", help="Resolve unresolved items")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_list_add_parser(subparsers):
+    p = subparsers.add_parser("list-add", help="Add items to a list")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--items", required=True, help="Comma-separated items")
+
+
+def _add_list_remove_parser(subparsers):
+    p = subparsers.add_parser("list-remove", help="Remove items from a list")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--items", required=True, help="Comma-separated item names")
+
+
+def _add_lists_parser(subparsers):
+    p = subparsers.add_parser("lists", help="Show all lists")
+    p.add_argument("--status", default=None, help="Filter: active|purchased|archived")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_list_clear_parser(subparsers):
+    p = subparsers.add_parser("list-clear", help="Delete a list")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--confirm", action="store_true", help="Actually delete")
+
+
+def _add_cart_build_parser(subparsers):
+    p = subparsers.add_parser("cart-build", help="Build Woolworths cart from list")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--confirm", action="store_true", help="Actually add to trolley")
+
+
+def _add_cart_status_parser(subparsers):
+    p = subparsers.add_parser("cart-status", help="Show current Woolworths trolley")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_checkout_parser(subparsers):
+    subparsers.add_parser("checkout", help="Print checkout link and instructions")
+
+
+def _add_complete_parser(subparsers):
+    p = subparsers.add_parser("complete", help="Mark list as purchased, log to history")
+    p.add_argument("--list-id", type=int, required=True, help="List ID")
+    p.add_argument("--total-paid", type=float, default=None, help="Amount actually paid")
+    p.add_argument("--notes", default=None, help="Order notes")
+    p.add_argument("--confirm", action="store_true", help="Actually complete")
+
+
+def _add_usual_parser(subparsers):
+    p = subparsers.add_parser("usual", help="Generate 'the usual' list from history")
+    p.add_argument("--min-frequency", type=int, default=0, help="Min order appearances (default: 3)")
+    p.add_argument("--lookback", type=int, default=0, help="Orders to look back (default: 10)")
+    p.add_argument("--exclude", default=None, help="Comma-separated items to exclude")
+    p.add_argument("--create-list", action="store_true", help="Create a list from the usual")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_specials_parser(subparsers):
+    p = subparsers.add_parser("specials", help="Check specials")
+    p.add_argument("--for-list", type=int, default=None, help="Check specials for items in a list")
+    p.add_argument("--usual-only", action="store_true", help="Only check your usual items")
+    p.add_argument("--limit", type=int, default=20, help="Max results (default: 20)")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_prices_parser(subparsers):
+    p = subparsers.add_parser("prices", help="Price history")
+    p.add_argument("--item", default=None, help="Item name to check")
+    p.add_argument("--all", action="store_true", help="Show all price history")
+    p.add_argument("--days", type=int, default=90, help="Lookback period in days (default: 90)")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+def _add_history_parser(subparsers):
+    p = subparsers.add_parser("history", help="Purchase history")
+    p.add_argument("--limit", type=int, default=10, help="Max orders to show (default: 10)")
+    p.add_argument("--days", type=int, default=None, help="Filter by recency (days)")
+    p.add_argument("--json", action="store_true", help="Emit raw JSON instead of formatted text")
+
+
+_PARSER_BUILDERS = {
+    "setup": _add_setup_parser,
+    "status": _add_status_parser,
+    "search": _add_search_parser,
+    "resolve": _add_resolve_parser,
+    "list-create": _add_list_create_parser,
+    "list-show": _add_list_show_parser,
+    "list-add": _add_list_add_parser,
+    "list-remove": _add_list_remove_parser,
+    "lists": _add_lists_parser,
+    "list-clear": _add_list_clear_parser,
+    "cart-build": _add_cart_build_parser,
+    "cart-status": _add_cart_status_parser,
+    "checkout": _add_checkout_parser,
+    "complete": _add_complete_parser,
+    "usual": _add_usual_parser,
+    "specials": _add_specials_parser,
+    "prices": _add_prices_parser,
+    "history": _add_history_parser,
+}
+
+
+_COMMANDS = {
+    "setup": cmd_setup,
+    "status": cmd_status,
+    "search": cmd_search,
+    "resolve": cmd_resolve,
+    "list-create": cmd_list_create,
+    "list-show": cmd_list_show,
+    "list-add": cmd_list_add,
+    "list-remove": cmd_list_remove,
+    "lists": cmd_lists,
+    "list-clear": cmd_list_clear,
+    "cart-build": cmd_cart_build,
+    "cart-status": cmd_cart_status,
+    "checkout": cmd_checkout,
+    "complete": cmd_complete,
+    "usual": cmd_usual,
+    "specials": cmd_specials,
+    "prices": cmd_prices,
+    "history": cmd_history,
+}
+
+
+# Commands that (can) hit the anonymous Woolworths API — worth starting
+# the bot-manager handshake before argument parsing and DB work
+_API_COMMANDS = frozenset({"search", "resolve", "specials", "prices", "list-show"})
+
+
+def _sniff_subcommand(argv):
+    """Return the command named on the command line, or None.
+
+    None means the eager path: build every subparser so full help and
+    unknown-command errors read exactly as before.
+    """
+    for token in argv:
+        if token in _COMMANDS:
+            return token
+        if not token.startswith("-"):
+            return None
+    return None
+
 
 def main():
+    # Static-output fast paths — these print fixed text, so skip parser
+    # construction entirely when they're the whole command line
+    if sys.argv[1:] == ["checkout"]:
+        cmd_checkout(None)
+        return
+    if sys.argv[1:] == ["--version"]:
+        from oakley_grocery import __version__
+        print(f"oakley-grocery {__version__}")
+        return
+
+    from oakley_grocery import __version__
+
     parser = argparse.ArgumentParser(
         prog="oakley-grocery",
         description="Oakley Grocery — smart shopping list manager with Woolworths integration",
     )
+    parser.add_argument("--version", action="version",
+                        version=f"%(prog)s {__version__}")
     subparsers = parser.add_subparsers(dest="command")
 
-    # setup
-    setup_parser = subparsers.add_parser("setup", help="Configure Woolworths credentials")
-    setup_parser.add_argument("--woolworths-key", default=None, help="Woolworths API key (optional)")
-    setup_parser.add_argument("--woolworths-cookies", default=None, help="Woolworths browser cookies (for cart)")
-
-    # status
-    subparsers.add_parser("status", help="Show version, API status, DB stats")
-
-    # search
-    search_parser = subparsers.add_parser("search", help="Search products (Woolworths or Dan Murphy's)")
-    search_parser.add_argument("--query", required=True, help="Search text")
-    search_parser.add_argument("--store", default="woolworths",
-                              choices=["woolworths", "dan-murphys"],
-                              help="Store to search (default: woolworths)")
-    search_parser.add_argument("--sort", default=None, help="Sort: TraderRelevance|PriceAsc|PriceDesc (Woolworths) or Relevance|PriceAsc|PriceDesc (Dan Murphy's)")
-    search_parser.add_argument("--specials-only", action="store_true", help="Only show items on special")
-    search_parser.add_argument("--limit", type=int, default=10, help="Max results (default: 10)")
-
-    # resolve
-    resolve_parser = subparsers.add_parser("resolve", help="Resolve an item or save preference")
-    resolve_parser.add_argument("--item", required=True, help="Generic item name (e.g. 'milk')")
-    resolve_parser.add_argument("--brand", default=None, help="Preferred brand")
-    resolve_parser.add_argument("--size", default=None, help="Preferred size")
-    resolve_parser.add_argument("--stockcode", type=int, default=None, help="Save specific product as preference")
-
-    # list-create
-    lc_parser = subparsers.add_parser("list-create", help="Create a shopping list")
-    lc_parser.add_argument("--name", required=True, help="List name")
-    lc_parser.add_argument("--items", default=None, help="Comma-separated items (e.g. 'milk,bread,2 eggs')")
-
-    # list-show
-    ls_parser = subparsers.add_parser("list-show", help="Show a shopping list")
-    ls_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    ls_parser.add_argument("--resolve", action="store_true", help="Resolve unresolved items")
-
-    # list-add
-    la_parser = subparsers.add_parser("list-add", help="Add items to a list")
-    la_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    la_parser.add_argument("--items", required=True, help="Comma-separated items")
-
-    # list-remove
-    lr_parser = subparsers.add_parser("list-remove", help="Remove items from a list")
-    lr_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    lr_parser.add_argument("--items", required=True, help="Comma-separated item names")
-
-    # lists
-    lists_parser = subparsers.add_parser("lists", help="Show all lists")
-    lists_parser.add_argument("--status", default=None, help="Filter: active|purchased|archived")
-
-    # list-clear
-    lcl_parser = subparsers.add_parser("list-clear", help="Delete a list")
-    lcl_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    lcl_parser.add_argument("--confirm", action="store_true", help="Actually delete")
-
-    # cart-build
-    cb_parser = subparsers.add_parser("cart-build", help="Build Woolworths cart from list")
-    cb_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    cb_parser.add_argument("--confirm", action="store_true", help="Actually add to trolley")
-
-    # cart-status
-    subparsers.add_parser("cart-status", help="Show current Woolworths trolley")
-
-    # checkout
-    subparsers.add_parser("checkout", help="Print checkout link and instructions")
-
-    # complete
-    comp_parser = subparsers.add_parser("complete", help="Mark list as purchased, log to history")
-    comp_parser.add_argument("--list-id", type=int, required=True, help="List ID")
-    comp_parser.add_argument("--total-paid", type=float, default=None, help="Amount actually paid")
-    comp_parser.add_argument("--notes", default=None, help="Order notes")
-    comp_parser.add_argument("--confirm", action="store_true", help="Actually complete")
-
-    # usual
-    usual_parser = subparsers.add_parser("usual", help="Generate 'the usual' list from history")
-    usual_parser.add_argument("--min-frequency", type=int, default=0, help="Min order appearances (default: 3)")
-    usual_parser.add_argument("--lookback", type=int, default=0, help="Orders to look back (default: 10)")
-    usual_parser.add_argument("--exclude", default=None, help="Comma-separated items to exclude")
-    usual_parser.add_argument("--create-list", action="store_true", help="Create a list from the usual")
-
-    # specials
-    spec_parser = subparsers.add_parser("specials", help="Check specials")
-    spec_parser.add_argument("--for-list", type=int, default=None, help="Check specials for items in a list")
-    spec_parser.add_argument("--usual-only", action="store_true", help="Only check your usual items")
-    spec_parser.add_argument("--limit", type=int, default=20, help="Max results (default: 20)")
-
-    # prices
-    prices_parser = subparsers.add_parser("prices", help="Price history")
-    prices_parser.add_argument("--item", default=None, help="Item name to check")
-    prices_parser.add_argument("--all", action="store_true", help="Show all price history")
-    prices_parser.add_argument("--days", type=int, default=90, help="Lookback period in days (default: 90)")
-
-    # history
-    hist_parser = subparsers.add_parser("history", help="Purchase history")
-    hist_parser.add_argument("--limit", type=int, default=10, help="Max orders to show (default: 10)")
-    hist_parser.add_argument("--days", type=int, default=None, help="Filter by recency (days)")
+    command = _sniff_subcommand(sys.argv[1:])
+    if command in _API_COMMANDS:
+        # Overlap the session handshake with parsing and command setup
+        woolworths.warmup()
+    if command is not None:
+        _PARSER_BUILDERS[command](subparsers)
+    else:
+        for build in _PARSER_BUILDERS.values():
+            build(subparsers)
 
     args = parser.parse_args()
 
-    commands = {
-        "setup": cmd_setup,
-        "status": cmd_status,
-        "search": cmd_search,
-        "resolve": cmd_resolve,
-        "list-create": cmd_list_create,
-        "list-show": cmd_list_show,
-        "list-add": cmd_list_add,
-        "list-remove": cmd_list_remove,
-        "lists": cmd_lists,
-        "list-clear": cmd_list_clear,
-        "cart-build": cmd_cart_build,
-        "cart-status": cmd_cart_status,
-        "checkout": cmd_checkout,
-        "complete": cmd_complete,
-        "usual": cmd_usual,
-        "specials": cmd_specials,
-        "prices": cmd_prices,
-        "history": cmd_history,
-    }
-
-    if args.command in commands:
-        commands[args.command](args)
+    if args.command in _COMMANDS:
+        _COMMANDS[args.command](args)
     else:
         parser.print_help()
 
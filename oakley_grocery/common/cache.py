@@ -1,38 +1,83 @@
 from __future__ import annotations
 
 import json
+import pickle
 import time
 from pathlib import Path
 from typing import Optional, Union
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — pickle is the fallback
+    orjson = None
+
 from .config import Config
 
 
 class FileCache:
-    """File-based JSON cache with TTL and stale fallback."""
+    """File-based cache with TTL and stale fallback.
+
+    Entries are orjson-encoded when orjson is installed — cached values
+    are plain product dicts/lists, which orjson round-trips faster than
+    pickle — and pickle (protocol 5) otherwise. Entries written under
+    either scheme, including .json files from pre-pickle versions, stay
+    readable and are rewritten in the current format on the next set().
+    """
 
     def __init__(self, namespace: str = "default"):
         Config.ensure_dirs()
         self.cache_dir = Config.cache_dir / namespace
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _key_path(self, key: str) -> Path:
-        safe_key = key.replace("/", "_").replace("\\", "_").replace("=", "_")
-        return self.cache_dir / f"{safe_key}.json"
+    def _safe_key(self, key: str) -> str:
+        return key.replace("/", "_").replace("\\", "_").replace("=", "_")
+
+    def _json_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self._safe_key(key)}.json"
+
+    def _pickle_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self._safe_key(key)}.pkl"
+
+    def _read_payload(self, key: str) -> Optional[dict]:
+        path = self._json_path(key)
+        if path.exists():
+            try:
+                raw = path.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, OSError):
+                return None
+
+        path = self._pickle_path(key)
+        if path.exists():
+            try:
+                return pickle.loads(path.read_bytes())
+            except (pickle.UnpicklingError, EOFError, OSError):
+                return None
+
+        return None
+
+    def _write_payload(self, key: str, payload: dict) -> None:
+        if orjson is not None:
+            self._json_path(key).write_bytes(orjson.dumps(payload))
+            self._pickle_path(key).unlink(missing_ok=True)
+        else:
+            self._pickle_path(key).write_bytes(pickle.dumps(payload, protocol=5))
+            self._json_path(key).unlink(missing_ok=True)
 
     def get(self, key: str, ttl: Optional[int] = None) -> Optional[Union[dict, list]]:
         """Return cached value if within TTL, or stale value up to 24hr as fallback."""
-        path = self._key_path(key)
-        if not path.exists():
-            return None
-
-        try:
-            data = json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+        data = self._read_payload(key)
+        if data is None:
             return None
 
         age = time.time() - data.get("_ts", 0)
 
+        # Entries written with an explicit TTL (negative/empty results)
+        # expire hard — no stale fallback
+        entry_ttl = data.get("_ttl")
+        if entry_ttl is not None:
+            return data.get("value") if age <= entry_ttl else None
+
         if ttl is not None and age <= ttl:
             return data.get("value")
 
@@ -45,15 +90,39 @@ class FileCache:
 
         return None
 
-    def set(self, key: str, value) -> None:
-        path = self._key_path(key)
+    def set(self, key: str, value, ttl: Optional[int] = None,
+            validators: Optional[dict] = None) -> None:
         payload = {"_ts": time.time(), "value": value}
-        path.write_text(json.dumps(payload, default=str))
+        if ttl is not None:
+            payload["_ttl"] = ttl
+        if validators:
+            payload["_validators"] = validators
+        self._write_payload(key, payload)
+
+    def revalidation(self, key: str) -> tuple[Optional[Union[dict, list]], Optional[dict]]:
+        """Return (value, validators) for an entry that stored HTTP validators.
+
+        Callers replay the validators as If-None-Match / If-Modified-Since
+        and touch() the entry on a 304 instead of refetching the body.
+        """
+        data = self._read_payload(key)
+        if not data or not data.get("_validators"):
+            return None, None
+        return data.get("value"), data["_validators"]
+
+    def touch(self, key: str) -> None:
+        """Reset an entry's age (e.g. after a 304 revalidation)."""
+        data = self._read_payload(key)
+        if data is not None:
+            data["_ts"] = time.time()
+            self._write_payload(key, data)
 
     def clear(self, key: Optional[str] = None) -> None:
         if key:
-            path = self._key_path(key)
-            path.unlink(missing_ok=True)
+            self._json_path(key).unlink(missing_ok=True)
+            self._pickle_path(key).unlink(missing_ok=True)
         else:
             for f in self.cache_dir.glob("*.json"):
                 f.unlink(missing_ok=True)
+            for f in self.cache_dir.glob("*.pkl"):
+                f.unlink(missing_ok=True)
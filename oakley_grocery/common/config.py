@@ -100,7 +100,15 @@ class Config:
     default_usual_min_frequency = DEFAULT_USUAL_MIN_FREQUENCY
     default_usual_lookback_orders = DEFAULT_USUAL_LOOKBACK_ORDERS
 
+    # Last (data_dir, cache_dir) pair ensure_dirs() created — keyed on the
+    # paths rather than a bare flag so repointing the dirs (tests) re-creates
+    _dirs_ready = ()
+
     @classmethod
     def ensure_dirs(cls):
+        dirs = (cls.data_dir, cls.cache_dir)
+        if dirs == cls._dirs_ready:
+            return
         cls.data_dir.mkdir(parents=True, exist_ok=True)
         cls.cache_dir.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = dirs
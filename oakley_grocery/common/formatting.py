@@ -1,24 +1,36 @@
 from __future__ import annotations
 
+import math
 from datetime import datetime
+from functools import lru_cache
+from io import StringIO
 from typing import Optional
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from .config import Config
 
-_tz = pytz.timezone(Config.timezone)
+_tz = ZoneInfo(Config.timezone)
 
 
 def now_aest() -> datetime:
     return datetime.now(_tz)
 
 
-def format_datetime_aest(dt: Optional[datetime] = None, fmt: str = "%d %b %Y %H:%M AEST") -> str:
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_DEFAULT_FMT = "%d %b %Y %H:%M AEST"
+
+
+def format_datetime_aest(dt: Optional[datetime] = None, fmt: str = _DEFAULT_FMT) -> str:
     if dt is None:
         dt = now_aest()
     elif dt.tzinfo is None:
-        dt = _tz.localize(dt)
+        dt = dt.replace(tzinfo=_tz)
+    if fmt is _DEFAULT_FMT:
+        # Format the common case directly — %b goes through the C locale
+        # machinery on every strftime call
+        return (f"{dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year}"
+                f" {dt.hour:02d}:{dt.minute:02d} AEST")
     return dt.strftime(fmt)
 
 
@@ -31,31 +43,44 @@ def format_list_item(text: str, indent: int = 0) -> str:
     return f"{prefix}- {text}"
 
 
+@lru_cache(maxsize=4096)
+def _format_cents(cents: int) -> str:
+    return f"${cents / 100:.2f}"
+
+
 def format_price(price: Optional[float]) -> str:
-    """Format a price like '$4.50'."""
+    """Format a price like '$4.50'.
+
+    Prices repeat heavily within a listing, so the float formatting is
+    cached on the rounded cents value.
+    """
     if price is None:
         return "N/A"
-    return f"${price:.2f}"
+    return _format_cents(round(price * 100))
 
 
-def format_price_change(current: float, previous: float) -> str:
+def format_price_change(current: float, previous: float,
+                        _fp=format_price) -> str:
     """Format price change like '$4.50 (was $5.00, -10%)'."""
     diff = current - previous
-    pct = (diff / previous) * 100 if previous else 0
+    pct = 100.0 * diff / previous if previous else 0.0
     direction = "+" if diff > 0 else ""
-    return f"{format_price(current)} (was {format_price(previous)}, {direction}{pct:.0f}%)"
+    return f"{_fp(current)} (was {_fp(previous)}, {direction}{pct:.0f}%)"
 
 
 def format_shopping_list(items: list[dict], show_prices: bool = True) -> str:
     """Format a shopping list for display."""
-    lines = []
-    total = 0.0
+    buf = StringIO()
+    write = buf.write
+    fp = format_price  # bound once — called up to twice per row below
+    line_totals = []
     for item in items:
-        qty = item.get("quantity", 1)
-        name = item.get("generic_name", "?")
-        product = item.get("product_name", "")
-        price = item.get("price")
-        checked = item.get("checked", 0)
+        get = item.get
+        qty = get("quantity", 1)
+        name = get("generic_name", "?")
+        product = get("product_name", "")
+        price = get("price")
+        checked = get("checked", 0)
 
         check = "[x]" if checked else "[ ]"
 
@@ -66,19 +91,23 @@ def format_shopping_list(items: list[dict], show_prices: bool = True) -> str:
 
         if show_prices and price is not None:
             line_total = price * qty
-            total += line_total
-            display += f" ({format_price(price)} ea, {format_price(line_total)})"
+            line_totals.append(line_total)
+            display += f" ({fp(price)} ea, {fp(line_total)})"
 
-        if item.get("on_special"):
+        if get("on_special"):
             display += " *SPECIAL*"
 
-        lines.append(display)
+        write(display)
+        write("\n")
 
+    # fsum keeps the money total exact instead of accumulating float error
+    total = math.fsum(line_totals)
     if show_prices and total > 0:
-        lines.append("")
-        lines.append(f"Estimated total: {format_price(total)}")
+        write(f"\nEstimated total: {fp(total)}\n")
 
-    return "\n".join(lines)
+    # Every line was written with a trailing newline, so dropping the last
+    # character reproduces the old "\n".join output exactly
+    return buf.getvalue()[:-1]
 
 
 def format_danmurphys_price(product: dict) -> str:
@@ -105,8 +134,9 @@ def format_danmurphys_price(product: dict) -> str:
 def truncate_for_telegram(text: str, max_length: int = Config.telegram_max_length) -> str:
     if len(text) <= max_length:
         return text
-    truncated = text[: max_length - 30]
-    last_newline = truncated.rfind("\n")
+    # Find the break point before slicing so only one copy is made
+    cut = max_length - 30
+    last_newline = text.rfind("\n", 0, cut)
     if last_newline > max_length // 2:
-        truncated = truncated[:last_newline]
-    return truncated + "\n\n... (truncated)"
+        cut = last_newline
+    return text[:cut] + "\n\n... (truncated)"
@@ -0,0 +1,33 @@
+"""Deferred module loading for startup-sensitive entry points."""
+
+from __future__ import annotations
+
+import importlib
+import types
+
+
+class LazyLoader(types.ModuleType):
+    """Module proxy that performs the real import on first attribute access.
+
+    Lets the CLI name its heavyweight dependencies once at module scope
+    while commands that never touch a module never pay its import cost.
+    On first access the proxy replaces itself in the caller's globals, so
+    subsequent lookups hit the real module directly.
+    """
+
+    def __init__(self, local_name: str, parent_globals: dict, module_name: str):
+        super().__init__(module_name)
+        self._local_name = local_name
+        self._parent_globals = parent_globals
+
+    def _load(self) -> types.ModuleType:
+        module = importlib.import_module(self.__name__)
+        self._parent_globals[self._local_name] = module
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, item: str):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
@@ -1,24 +1,42 @@
+import threading
 import time
 
 
 class RateLimiter:
-    """Token-bucket rate limiter for API calls."""
+    """Token-bucket rate limiter for API calls.
+
+    State is two floats (token count + last refill time) updated under a
+    lock held only for the arithmetic — O(1) per acquire, unlike the old
+    timestamp-list scan. Waiting happens outside the lock, so concurrent
+    cart-build workers queue on the clock rather than on each other.
+    """
 
     def __init__(self, max_calls: int = 10, period: float = 1.0):
         self.max_calls = max_calls
         self.period = period
-        self.calls: list[float] = []
+        self._rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Take a token if available; otherwise return seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_calls,
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+            self._last_refill = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
 
     def acquire(self) -> None:
         """Block until a call slot is available."""
-        now = time.time()
-        self.calls = [t for t in self.calls if now - t < self.period]
-
-        if len(self.calls) >= self.max_calls:
-            oldest = self.calls[0]
-            sleep_time = self.period - (now - oldest)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            self.calls = [t for t in self.calls if time.time() - t < self.period]
-
-        self.calls.append(time.time())
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0.0:
+                return
+            time.sleep(wait)
@@ -5,6 +5,13 @@ from __future__ import annotations
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — resp.json() is the fallback
+    orjson = None
 
 from oakley_grocery.common.config import Config
 from oakley_grocery.common.cache import FileCache
@@ -16,9 +23,15 @@ _limiter = RateLimiter(
     period=Config.danmurphys_rate_limit_period,
 )
 
+# Hot-path constants hoisted out of per-call Config attribute lookups
+_SEARCH_URL = Config.danmurphys_search_url
+_SEARCH_TTL = Config.cache_ttl["danmurphys_search"]
+_REQUEST_TIMEOUT = Config.request_timeout
+
 _HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Accept": "application/json, text/plain, */*",
+    "Accept-Encoding": "gzip",
     "Accept-Language": "en-AU,en;q=0.9",
     "Content-Type": "application/json",
     "Origin": Config.danmurphys_homepage_url,
@@ -41,6 +54,16 @@ def _get_session() -> requests.Session:
     _session = requests.Session()
     _session.headers.update(_HEADERS)
 
+    # Pooled keep-alive connections with retries on transient gateway errors,
+    # so repeat searches skip TCP+TLS setup
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    _session.mount("https://", adapter)
+    _session.headers["Connection"] = "keep-alive"
+
     # Hit homepage to acquire Cloudflare cookies
     try:
         _session.get(
@@ -59,17 +82,32 @@ def _reset_session() -> None:
     _session = None
 
 
-def _extract_detail(details: list[dict], key: str) -> str:
-    """Extract a value from the AdditionalDetails array by key name."""
+def _normalize_details(details: Optional[list]) -> dict:
+    """Build a lowercase Name→Value map from the AdditionalDetails array."""
+    if not details:
+        return {}
+    return {d.get("Name", "").lower(): d.get("Value", "") for d in details}
+
+
+def _stringify(val) -> str:
+    """Render a detail value as a string; booleans and empties become ''."""
+    if isinstance(val, bool):
+        return ""
+    return str(val) if val else ""
+
+
+def _extract_detail(details, key: str) -> str:
+    """Extract a value from AdditionalDetails by key name.
+
+    Accepts either the raw array or a map prebuilt by _normalize_details;
+    _parse_product builds the map once so its ~10 lookups stay O(1) instead
+    of rescanning (and re-lowercasing) the array per key.
+    """
     if not details:
         return ""
-    for detail in details:
-        if detail.get("Name", "").lower() == key.lower():
-            val = detail.get("Value", "")
-            if isinstance(val, bool):
-                return ""
-            return str(val) if val else ""
-    return ""
+    if not isinstance(details, dict):
+        details = _normalize_details(details)
+    return _stringify(details.get(key.lower(), ""))
 
 
 def _parse_product(raw: dict) -> dict:
@@ -100,8 +138,9 @@ def _parse_product(raw: dict) -> dict:
     on_special = raw.get("IsSpecial", False)
     amount_saved = raw.get("AmountSaved")
 
-    # Additional details
-    details = raw.get("AdditionalDetails", []) or []
+    # Additional details — normalised once, looked up per field below
+    details = _normalize_details(raw.get("AdditionalDetails"))
+    detail = details.get
 
     return {
         "stockcode": raw.get("Stockcode"),
@@ -117,14 +156,14 @@ def _parse_product(raw: dict) -> dict:
         "amount_saved": amount_saved,
         "is_member_offer": is_member_offer,
         # Alcohol details
-        "varietal": _extract_detail(details, "varietal"),
-        "region": _extract_detail(details, "webregionoforigin"),
-        "alcohol_pct": _extract_detail(details, "webalcoholpercentage"),
-        "rating": _extract_detail(details, "webaverageproductrating"),
-        "review_count": _extract_detail(details, "webtotalreviewcount"),
-        "wine_body": _extract_detail(details, "webwinebody"),
-        "category": _extract_detail(details, "webmaincategory"),
-        "description": _extract_detail(details, "webdescriptionshort"),
+        "varietal": _stringify(detail("varietal")),
+        "region": _stringify(detail("webregionoforigin")),
+        "alcohol_pct": _stringify(detail("webalcoholpercentage")),
+        "rating": _stringify(detail("webaverageproductrating")),
+        "review_count": _stringify(detail("webtotalreviewcount")),
+        "wine_body": _stringify(detail("webwinebody")),
+        "category": _stringify(detail("webmaincategory")),
+        "description": _stringify(detail("webdescriptionshort")),
         # Common
         "image_url": raw.get("ImageFile", ""),
         "store": "dan-murphys",
@@ -140,7 +179,7 @@ def search_products(query: str, page: int = 1, page_size: int = 0,
         sort_by = Config.danmurphys_default_sort
 
     cache_key = f"dm_search_{query}_{page}_{page_size}_{sort_by}"
-    cached = _cache.get(cache_key, ttl=Config.cache_ttl["danmurphys_search"])
+    cached = _cache.get(cache_key, ttl=_SEARCH_TTL)
     if cached:
         return cached
 
@@ -159,12 +198,14 @@ def search_products(query: str, page: int = 1, page_size: int = 0,
 
     try:
         resp = session.post(
-            Config.danmurphys_search_url,
+            _SEARCH_URL,
             json=payload,
-            timeout=Config.request_timeout,
+            timeout=_REQUEST_TIMEOUT,
         )
         resp.raise_for_status()
-        data = resp.json()
+        # Parse the decompressed bytes directly — skips requests' charset
+        # detection and the slower stdlib json parser
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
     except requests.RequestException as e:
         _reset_session()
         stale = _cache.get(cache_key)
@@ -172,12 +213,11 @@ def search_products(query: str, page: int = 1, page_size: int = 0,
             return stale
         raise RuntimeError(f"Dan Murphy's search failed: {e}") from e
 
-    products = []
-    bundles = data.get("Products", [])
-    for bundle in bundles:
-        items = bundle.get("Products", [])
-        for item in items:
-            products.append(_parse_product(item))
+    products = [
+        _parse_product(item)
+        for bundle in data.get("Products", [])
+        for item in bundle.get("Products", [])
+    ]
 
     _cache.set(cache_key, products)
     return products
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional
 
 from oakley_grocery.common.config import Config
 
 _conn: Optional[sqlite3.Connection] = None
+_in_transaction = False
 
 
 def _get_conn() -> sqlite3.Connection:
@@ -17,14 +21,50 @@ def _get_conn() -> sqlite3.Connection:
         return _conn
 
     Config.ensure_dirs()
-    _conn = sqlite3.connect(str(Config.db_path), timeout=10)
+    # cached_statements above the default 128 keeps every distinct query in
+    # this module permanently prepared
+    _conn = sqlite3.connect(str(Config.db_path), timeout=10, cached_statements=512)
     _conn.row_factory = sqlite3.Row
     _conn.execute("PRAGMA journal_mode=WAL")
     _conn.execute("PRAGMA foreign_keys=ON")
+    # synchronous=NORMAL skips the per-commit fsync under WAL — a crash can
+    # lose the last few writes, which is acceptable for a grocery list
+    _conn.execute("PRAGMA synchronous=NORMAL")
+    _conn.execute("PRAGMA temp_store=MEMORY")
+    _conn.execute("PRAGMA cache_size=-65536")
+    _conn.execute("PRAGMA mmap_size=268435456")
+    _conn.execute("PRAGMA busy_timeout=5000")
     _init_schema(_conn)
     return _conn
 
 
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commit unless a transaction() block is batching the writes."""
+    if not _in_transaction:
+        conn.commit()
+
+
+@contextmanager
+def transaction():
+    """Group several write helpers into a single commit.
+
+    Inside the block the helpers skip their own commit, so a bulk save
+    (logging an order's items, building a list) costs one fsync instead
+    of one per call. Rolls back on any exception.
+    """
+    global _in_transaction
+    conn = _get_conn()
+    _in_transaction = True
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _in_transaction = False
+
+
 def _init_schema(conn: sqlite3.Connection) -> None:
     """Create tables if they don't exist."""
     conn.executescript("""
@@ -98,32 +138,96 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         );
 
         CREATE INDEX IF NOT EXISTS idx_list_items_list_id ON list_items(list_id);
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_list_items_list_generic
+            ON list_items(list_id, generic_name);
         CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items(order_id);
+        CREATE INDEX IF NOT EXISTS idx_order_items_order_generic
+            ON order_items(order_id, generic_name, stockcode, product_name,
+                           brand, price, quantity);
+        CREATE INDEX IF NOT EXISTS idx_order_items_generic
+            ON order_items(generic_name, order_id, quantity, price);
+        CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_price_history_stockcode ON price_history(stockcode);
         CREATE INDEX IF NOT EXISTS idx_preferences_generic ON preferences(generic_name);
         CREATE INDEX IF NOT EXISTS idx_lists_status ON lists(status);
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS preferences_fts USING fts5(
+            generic_name, product_name, brand,
+            content='preferences', content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS preferences_fts_ai
+        AFTER INSERT ON preferences BEGIN
+            INSERT INTO preferences_fts(rowid, generic_name, product_name, brand)
+            VALUES (new.id, new.generic_name, new.product_name, new.brand);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS preferences_fts_ad
+        AFTER DELETE ON preferences BEGIN
+            INSERT INTO preferences_fts(preferences_fts, rowid, generic_name, product_name, brand)
+            VALUES ('delete', old.id, old.generic_name, old.product_name, old.brand);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS preferences_fts_au
+        AFTER UPDATE ON preferences BEGIN
+            INSERT INTO preferences_fts(preferences_fts, rowid, generic_name, product_name, brand)
+            VALUES ('delete', old.id, old.generic_name, old.product_name, old.brand);
+            INSERT INTO preferences_fts(rowid, generic_name, product_name, brand)
+            VALUES (new.id, new.generic_name, new.product_name, new.brand);
+        END;
     """)
 
+    # Backfill the FTS mirror for databases created before it existed
+    missing = conn.execute(
+        """SELECT (SELECT COUNT(*) FROM preferences)
+                - (SELECT COUNT(*) FROM preferences_fts)"""
+    ).fetchone()[0]
+    if missing:
+        conn.execute("INSERT INTO preferences_fts(preferences_fts) VALUES('rebuild')")
+        conn.commit()
+
 
 # ─── Preferences CRUD ────────────────────────────────────────────────────────
 
-def get_preference(generic_name: str) -> Optional[dict]:
-    """Get a preference by generic name."""
+@lru_cache(maxsize=1024)
+def _get_preference_cached(generic: str) -> Optional[dict]:
     conn = _get_conn()
     row = conn.execute(
         "SELECT * FROM preferences WHERE generic_name = ? LIMIT 1",
-        (generic_name.lower().strip(),),
+        (generic,),
     ).fetchone()
     return dict(row) if row else None
 
 
+def _clear_preference_caches() -> None:
+    """Drop memoized preference state after any write to the table.
+
+    The resolver's memo bakes preference hits into resolved results, so
+    it has to go stale together with the row cache; imported lazily
+    because resolver imports this module.
+    """
+    _get_preference_cached.cache_clear()
+    from oakley_grocery import resolver
+    resolver._resolve_cached.cache_clear()
+
+
+def get_preference(generic_name: str) -> Optional[dict]:
+    """Get a preference by generic name.
+
+    Lookups are cached per normalized name; every preference write
+    clears the cache. Callers get a copy so the cached row stays clean.
+    """
+    pref = _get_preference_cached(generic_name.lower().strip())
+    return dict(pref) if pref else None
+
+
 def get_all_preferences() -> list[dict]:
     """Get all preferences."""
     conn = _get_conn()
     rows = conn.execute(
         "SELECT * FROM preferences ORDER BY purchase_count DESC"
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 def save_preference(generic_name: str, stockcode: int, product_name: str,
@@ -132,49 +236,80 @@ def save_preference(generic_name: str, stockcode: int, product_name: str,
     """Save or update a product preference. Returns row id."""
     conn = _get_conn()
     generic = generic_name.lower().strip()
-    existing = get_preference(generic)
+    _clear_preference_caches()
 
-    if existing:
-        conn.execute(
-            """UPDATE preferences SET stockcode = ?, product_name = ?, brand = ?,
-               package_size = ?, purchase_count = purchase_count + 1,
-               last_price = COALESCE(?, last_price),
+    row = conn.execute(
+        """INSERT INTO preferences (generic_name, stockcode, product_name,
+           brand, package_size, last_price)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(generic_name) DO UPDATE SET
+               stockcode = excluded.stockcode,
+               product_name = excluded.product_name,
+               brand = excluded.brand,
+               package_size = excluded.package_size,
+               purchase_count = purchase_count + 1,
+               last_price = COALESCE(excluded.last_price, last_price),
                updated_at = datetime('now')
-               WHERE generic_name = ?""",
-            (stockcode, product_name, brand, package_size, price, generic),
-        )
-        conn.commit()
-        return existing["id"]
-    else:
-        cursor = conn.execute(
-            """INSERT INTO preferences (generic_name, stockcode, product_name,
-               brand, package_size, last_price)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (generic, stockcode, product_name, brand, package_size, price),
-        )
-        conn.commit()
-        return cursor.lastrowid
+           RETURNING id""",
+        (generic, stockcode, product_name, brand, package_size, price),
+    ).fetchone()
+    _commit(conn)
+    return row["id"]
+
+
+def save_preferences_bulk(rows: list[tuple]) -> int:
+    """Bulk save-or-update preferences in one statement. Returns rows processed.
+
+    Each tuple is (generic_name, stockcode, product_name, brand,
+    package_size, price), with the same upsert semantics as
+    save_preference.
+    """
+    conn = _get_conn()
+    cursor = conn.executemany(
+        """INSERT INTO preferences (generic_name, stockcode, product_name,
+           brand, package_size, last_price)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(generic_name) DO UPDATE SET
+               stockcode = excluded.stockcode,
+               product_name = excluded.product_name,
+               brand = excluded.brand,
+               package_size = excluded.package_size,
+               purchase_count = purchase_count + 1,
+               last_price = COALESCE(excluded.last_price, last_price),
+               updated_at = datetime('now')""",
+        [(name.lower().strip(), *rest) for name, *rest in rows],
+    )
+    _clear_preference_caches()
+    _commit(conn)
+    return cursor.rowcount
 
 
 def delete_preference(generic_name: str) -> bool:
     """Delete a preference. Returns True if deleted."""
     conn = _get_conn()
+    _clear_preference_caches()
     cursor = conn.execute(
         "DELETE FROM preferences WHERE generic_name = ?",
         (generic_name.lower().strip(),),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.rowcount > 0
 
 
 def search_preferences(query: str) -> list[dict]:
-    """Search preferences by generic name (substring match)."""
+    """Search preferences by name, product or brand (prefix word match)."""
     conn = _get_conn()
+    q = query.lower().strip().replace('"', '""')
+    if not q:
+        return []
     rows = conn.execute(
-        "SELECT * FROM preferences WHERE generic_name LIKE ? ORDER BY purchase_count DESC",
-        (f"%{query.lower().strip()}%",),
+        """SELECT p.* FROM preferences_fts f
+           JOIN preferences p ON p.id = f.rowid
+           WHERE preferences_fts MATCH ?
+           ORDER BY p.purchase_count DESC""",
+        (f'"{q}"*',),
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 # ─── Lists CRUD ──────────────────────────────────────────────────────────────
@@ -186,7 +321,7 @@ def create_list(name: str) -> int:
         "INSERT INTO lists (name) VALUES (?)",
         (name,),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.lastrowid
 
 
@@ -212,7 +347,32 @@ def get_lists(status: Optional[str] = None) -> list[dict]:
         rows = conn.execute(
             "SELECT * FROM lists ORDER BY created_at DESC"
         ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
+
+
+def get_list_summaries(status: Optional[str] = None) -> list[dict]:
+    """Get all lists with per-list item aggregates in a single query.
+
+    Each row is the lists columns plus "item_count", "resolved_count" and
+    "est_total" (sum of price * quantity over priced items), so callers
+    rendering an overview don't need a per-list items query.
+    """
+    conn = _get_conn()
+    where = "WHERE l.status = ?" if status else ""
+    params = (status,) if status else ()
+    rows = conn.execute(
+        f"""SELECT l.*,
+                   COUNT(li.id) as item_count,
+                   COALESCE(SUM(li.resolved), 0) as resolved_count,
+                   COALESCE(SUM(li.price * li.quantity), 0) as est_total
+            FROM lists l
+            LEFT JOIN list_items li ON li.list_id = l.id
+            {where}
+            GROUP BY l.id
+            ORDER BY l.created_at DESC""",
+        params,
+    ).fetchall()
+    return list(map(dict, rows))
 
 
 def update_list_status(list_id: int, status: str, total_estimate: Optional[float] = None) -> bool:
@@ -228,7 +388,7 @@ def update_list_status(list_id: int, status: str, total_estimate: Optional[float
             "UPDATE lists SET status = ?, updated_at = datetime('now') WHERE id = ?",
             (status, list_id),
         )
-    conn.commit()
+    _commit(conn)
     return cursor.rowcount > 0
 
 
@@ -236,7 +396,7 @@ def delete_list(list_id: int) -> bool:
     """Delete a list and its items. Returns True if deleted."""
     conn = _get_conn()
     cursor = conn.execute("DELETE FROM lists WHERE id = ?", (list_id,))
-    conn.commit()
+    _commit(conn)
     return cursor.rowcount > 0
 
 
@@ -244,32 +404,38 @@ def delete_list(list_id: int) -> bool:
 
 def add_list_item(list_id: int, generic_name: str, quantity: int = 1,
                   unit: Optional[str] = None) -> int:
-    """Add an item to a list. Returns item id."""
+    """Add an item to a list, merging quantities on duplicates. Returns item id."""
     conn = _get_conn()
     generic = generic_name.lower().strip()
 
-    # Check for existing item — merge quantities
-    existing = conn.execute(
-        "SELECT * FROM list_items WHERE list_id = ? AND generic_name = ?",
-        (list_id, generic),
+    row = conn.execute(
+        """INSERT INTO list_items (list_id, generic_name, quantity, unit)
+           VALUES (?, ?, ?, ?)
+           ON CONFLICT(list_id, generic_name)
+           DO UPDATE SET quantity = quantity + excluded.quantity
+           RETURNING id""",
+        (list_id, generic, quantity, unit),
     ).fetchone()
+    _commit(conn)
+    return row["id"]
 
-    if existing:
-        new_qty = existing["quantity"] + quantity
-        conn.execute(
-            "UPDATE list_items SET quantity = ? WHERE id = ?",
-            (new_qty, existing["id"]),
-        )
-        conn.commit()
-        return existing["id"]
 
-    cursor = conn.execute(
-        """INSERT INTO list_items (list_id, generic_name, quantity, unit)
-           VALUES (?, ?, ?, ?)""",
-        (list_id, generic, quantity, unit),
+def add_list_items_bulk(list_id: int, rows: list[tuple]) -> int:
+    """Bulk-add (generic_name, quantity) pairs to a list, merging duplicates.
+
+    One executemany upsert and one commit instead of a statement per
+    item. Returns the number of rows processed.
+    """
+    conn = _get_conn()
+    cursor = conn.executemany(
+        """INSERT INTO list_items (list_id, generic_name, quantity)
+           VALUES (?, ?, ?)
+           ON CONFLICT(list_id, generic_name)
+           DO UPDATE SET quantity = quantity + excluded.quantity""",
+        [(list_id, name.lower().strip(), qty) for name, qty in rows],
     )
-    conn.commit()
-    return cursor.lastrowid
+    _commit(conn)
+    return cursor.rowcount
 
 
 def get_list_items(list_id: int) -> list[dict]:
@@ -279,7 +445,7 @@ def get_list_items(list_id: int) -> list[dict]:
         "SELECT * FROM list_items WHERE list_id = ? ORDER BY id ASC",
         (list_id,),
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 def update_list_item(item_id: int, **kwargs) -> bool:
@@ -299,10 +465,26 @@ def update_list_item(item_id: int, **kwargs) -> bool:
     values.append(item_id)
     sql = f"UPDATE list_items SET {', '.join(sets)} WHERE id = ?"
     cursor = conn.execute(sql, values)
-    conn.commit()
+    _commit(conn)
     return cursor.rowcount > 0
 
 
+def resolve_list_items_bulk(rows: list[tuple]) -> int:
+    """Mark many list items resolved in one statement. Returns rows updated.
+
+    Each tuple is (stockcode, product_name, price, item_id); the fixed
+    column set lets SQLite prepare the UPDATE once and bind per row.
+    """
+    conn = _get_conn()
+    cursor = conn.executemany(
+        """UPDATE list_items SET stockcode = ?, product_name = ?,
+           price = ?, resolved = 1 WHERE id = ?""",
+        rows,
+    )
+    _commit(conn)
+    return cursor.rowcount
+
+
 def remove_list_item(list_id: int, generic_name: str) -> bool:
     """Remove an item from a list by generic name."""
     conn = _get_conn()
@@ -310,10 +492,31 @@ def remove_list_item(list_id: int, generic_name: str) -> bool:
         "DELETE FROM list_items WHERE list_id = ? AND generic_name = ?",
         (list_id, generic_name.lower().strip()),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.rowcount > 0
 
 
+def remove_list_items_bulk(list_id: int, names: list[str]) -> list[str]:
+    """Remove several items from a list in one statement.
+
+    Returns the generic names actually deleted, so callers can report
+    which requested names were missing.
+    """
+    if not names:
+        return []
+    normalized = [n.lower().strip() for n in names]
+    conn = _get_conn()
+    placeholders = ",".join("?" * len(normalized))
+    rows = conn.execute(
+        f"""DELETE FROM list_items WHERE list_id = ?
+            AND generic_name IN ({placeholders})
+            RETURNING generic_name""",
+        (list_id, *normalized),
+    ).fetchall()
+    _commit(conn)
+    return [r["generic_name"] for r in rows]
+
+
 # ─── Orders CRUD ─────────────────────────────────────────────────────────────
 
 def create_order(list_id: Optional[int], total_estimate: Optional[float],
@@ -326,7 +529,7 @@ def create_order(list_id: Optional[int], total_estimate: Optional[float],
            VALUES (?, ?, ?, ?, ?, ?)""",
         (list_id, total_estimate, total_paid, item_count, store, notes),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.lastrowid
 
 
@@ -343,10 +546,27 @@ def add_order_item(order_id: int, generic_name: str, stockcode: Optional[int],
         (order_id, generic_name, stockcode, product_name, brand,
          quantity, price, 1 if on_special else 0),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.lastrowid
 
 
+def add_order_items(order_id: int, items: list[tuple]) -> int:
+    """Bulk-insert order items in one statement. Returns rows inserted.
+
+    Each tuple is (generic_name, stockcode, product_name, brand,
+    quantity, price, on_special).
+    """
+    conn = _get_conn()
+    cursor = conn.executemany(
+        """INSERT INTO order_items (order_id, generic_name, stockcode, product_name,
+           brand, quantity, price, on_special)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        [(order_id, *row) for row in items],
+    )
+    _commit(conn)
+    return cursor.rowcount
+
+
 def get_orders(limit: int = 20, days: Optional[int] = None) -> list[dict]:
     """Get orders, optionally filtered by recency."""
     conn = _get_conn()
@@ -362,7 +582,7 @@ def get_orders(limit: int = 20, days: Optional[int] = None) -> list[dict]:
             "SELECT * FROM orders ORDER BY created_at DESC LIMIT ?",
             (limit,),
         ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 def get_order(order_id: int) -> Optional[dict]:
@@ -382,7 +602,7 @@ def get_order_items(order_id: int) -> list[dict]:
         "SELECT * FROM order_items WHERE order_id = ? ORDER BY id ASC",
         (order_id,),
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 # ─── Price History ───────────────────────────────────────────────────────────
@@ -396,10 +616,35 @@ def record_price(stockcode: int, product_name: str, price: float,
            VALUES (?, ?, ?, ?)""",
         (stockcode, product_name, price, 1 if on_special else 0),
     )
-    conn.commit()
+    _commit(conn)
     return cursor.lastrowid
 
 
+def get_latest_prices() -> dict:
+    """Map stockcode -> most recently recorded price."""
+    conn = _get_conn()
+    rows = conn.execute(
+        """SELECT stockcode, price FROM price_history
+           WHERE id IN (SELECT MAX(id) FROM price_history GROUP BY stockcode)"""
+    ).fetchall()
+    return {r["stockcode"]: r["price"] for r in rows}
+
+
+def record_prices(observations: list[tuple]) -> int:
+    """Bulk-record price observations in one statement. Returns rows inserted.
+
+    Each tuple is (stockcode, product_name, price, on_special).
+    """
+    conn = _get_conn()
+    cursor = conn.executemany(
+        """INSERT INTO price_history (stockcode, product_name, price, on_special)
+           VALUES (?, ?, ?, ?)""",
+        observations,
+    )
+    _commit(conn)
+    return cursor.rowcount
+
+
 def get_price_history(stockcode: Optional[int] = None, days: int = 90,
                       limit: int = 50) -> list[dict]:
     """Get price history, optionally for a specific product."""
@@ -418,7 +663,7 @@ def get_price_history(stockcode: Optional[int] = None, days: int = 90,
                ORDER BY recorded_at DESC LIMIT ?""",
             (f"-{days}", limit),
         ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
 
 
 # ─── Stats helpers ───────────────────────────────────────────────────────────
@@ -444,36 +689,86 @@ def count_orders() -> int:
     return row[0]
 
 
-def get_frequent_items(min_orders: int = 3, lookback: int = 10) -> list[dict]:
+def get_frequent_items(min_orders: int = 3, lookback: int = 10,
+                       exclude_list_id: Optional[int] = None) -> list[dict]:
     """Get items that appear frequently in recent orders.
-    Returns items appearing in min_orders+ of the last 'lookback' orders."""
-    conn = _get_conn()
-
-    # Get the last N order IDs
-    order_ids = conn.execute(
-        "SELECT id FROM orders ORDER BY created_at DESC LIMIT ?",
-        (lookback,),
-    ).fetchall()
-
-    if not order_ids:
-        return []
 
-    ids = [r["id"] for r in order_ids]
-    placeholders = ",".join("?" * len(ids))
+    Returns items appearing in min_orders+ of the last 'lookback' orders.
+    With exclude_list_id, items already on that list are filtered out by
+    an anti-join inside the query.
+    """
+    conn = _get_conn()
 
+    exclude_sql = ""
+    params: list = [lookback]
+    if exclude_list_id is not None:
+        exclude_sql = """AND generic_name NOT IN (
+                SELECT generic_name FROM list_items WHERE list_id = ?)
+            """
+        params.append(exclude_list_id)
+    params.append(min_orders)
+
+    # The last-N-orders window lives in a subquery, so the whole
+    # aggregation is one statement instead of a fetch plus an IN list
     rows = conn.execute(
         f"""SELECT generic_name, COUNT(DISTINCT order_id) as frequency,
                    MAX(product_name) as product_name, MAX(brand) as brand,
                    MAX(stockcode) as stockcode, AVG(price) as avg_price,
                    SUM(quantity) as total_qty
             FROM order_items
-            WHERE order_id IN ({placeholders})
-            GROUP BY generic_name
+            WHERE order_id IN (
+                SELECT id FROM orders ORDER BY created_at DESC LIMIT ?)
+            {exclude_sql}GROUP BY generic_name
             HAVING frequency >= ?
             ORDER BY frequency DESC, total_qty DESC""",
-        (*ids, min_orders),
+        params,
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(dict, rows))
+
+
+def get_spending_summary_all(days: int = 30, top_limit: int = 10) -> dict:
+    """Get spending statistics plus top items by spend in a single query.
+
+    Returns the get_spending_stats fields with an extra "top_items" list,
+    scanning the date-filtered orders once instead of running two separate
+    aggregates.
+    """
+    conn = _get_conn()
+    row = conn.execute(
+        """WITH scoped AS (
+               SELECT id, total_paid FROM orders
+               WHERE created_at >= datetime('now', ? || ' days')
+           ),
+           top AS (
+               SELECT oi.generic_name,
+                      SUM(oi.quantity) as total_qty,
+                      SUM(oi.price * oi.quantity) as total_spend,
+                      COUNT(DISTINCT oi.order_id) as appearances
+               FROM order_items oi
+               JOIN scoped s ON oi.order_id = s.id
+               WHERE oi.price IS NOT NULL
+               GROUP BY oi.generic_name
+               ORDER BY total_spend DESC
+               LIMIT ?
+           )
+           SELECT COUNT(*) as order_count,
+                  COALESCE(SUM(total_paid), 0) as total_spent,
+                  COALESCE(AVG(total_paid), 0) as avg_order,
+                  COALESCE(MAX(total_paid), 0) as max_order,
+                  COALESCE(MIN(total_paid), 0) as min_order,
+                  (SELECT json_group_array(json_object(
+                       'generic_name', generic_name,
+                       'total_qty', total_qty,
+                       'total_spend', total_spend,
+                       'appearances', appearances)) FROM top) as top_items
+           FROM scoped
+           WHERE total_paid IS NOT NULL""",
+        (f"-{days}", top_limit),
+    ).fetchone()
+
+    result = dict(row)
+    result["top_items"] = json.loads(result["top_items"] or "[]")
+    return result
 
 
 def get_spending_stats(days: int = 30) -> dict:
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import math
+import re
 from typing import Optional
 
 from oakley_grocery import db
-from oakley_grocery.resolver import resolve_item
+from oakley_grocery.resolver import resolve_list
 
 
 def create_list(name: str, items: Optional[list[str]] = None) -> dict:
@@ -18,14 +20,14 @@ def create_list(name: str, items: Optional[list[str]] = None) -> dict:
     Returns:
         {"list_id": int, "name": str, "item_count": int}
     """
-    list_id = db.create_list(name)
-    item_count = 0
+    with db.transaction():
+        list_id = db.create_list(name)
+        item_count = 0
 
-    if items:
-        for item_str in items:
-            generic_name, quantity = _parse_item_string(item_str)
-            db.add_list_item(list_id, generic_name, quantity)
-            item_count += 1
+        if items:
+            parsed = _parse_items_batch(items)
+            db.add_list_items_bulk(list_id, parsed)
+            item_count = len(parsed)
 
     return {"list_id": list_id, "name": name, "item_count": item_count}
 
@@ -47,17 +49,15 @@ def add_items(list_id: int, items: list[str]) -> dict:
         raise ValueError(f"List {list_id} is {lst['status']}, not active")
 
     existing = {item["generic_name"] for item in db.get_list_items(list_id)}
-    added = 0
-    merged = 0
-
-    for item_str in items:
-        generic_name, quantity = _parse_item_string(item_str)
-        if generic_name in existing:
-            merged += 1
-        else:
-            added += 1
-        db.add_list_item(list_id, generic_name, quantity)
-        existing.add(generic_name)
+    parsed = _parse_items_batch(items)
+
+    # Count distinct names with set operations instead of per-item lookups
+    names = {name for name, _ in parsed}
+    merged = len(names & existing)
+    added = len(names) - merged
+
+    if parsed:
+        db.add_list_items_bulk(list_id, parsed)
 
     return {"added": added, "merged": merged}
 
@@ -72,16 +72,11 @@ def remove_items(list_id: int, item_names: list[str]) -> dict:
     if not lst:
         raise ValueError(f"List {list_id} not found")
 
-    removed = 0
-    not_found = []
-
-    for name in item_names:
-        if db.remove_list_item(list_id, name):
-            removed += 1
-        else:
-            not_found.append(name)
+    removed_names = set(db.remove_list_items_bulk(list_id, item_names))
+    not_found = [n for n in item_names
+                 if n.lower().strip() not in removed_names]
 
-    return {"removed": removed, "not_found": not_found}
+    return {"removed": len(removed_names), "not_found": not_found}
 
 
 def get_list(list_id: int, resolve: bool = False) -> dict:
@@ -97,23 +92,31 @@ def get_list(list_id: int, resolve: bool = False) -> dict:
     items = db.get_list_items(list_id)
 
     if resolve:
+        # _resolve_list_items patches the item dicts with what it writes,
+        # so no reload is needed
         stats = _resolve_list_items(list_id, items)
-        items = db.get_list_items(list_id)  # Reload after resolution
+        total = 0.0
+        for item in items:
+            if item.get("price") is not None:
+                total += item["price"] * item.get("quantity", 1)
     else:
-        resolved = sum(1 for i in items if i["resolved"])
+        # One pass counts resolved items and accumulates the estimate
+        total = 0.0
+        resolved = 0
+        for item in items:
+            if item["resolved"]:
+                resolved += 1
+            if item.get("price") is not None:
+                total += item["price"] * item.get("quantity", 1)
         stats = {
             "total": len(items),
             "resolved": resolved,
             "unresolved": len(items) - resolved,
         }
 
-    # Calculate total estimate
-    total = 0.0
-    for item in items:
-        if item.get("price") is not None:
-            total += item["price"] * item.get("quantity", 1)
-
-    if total > 0:
+    # Only persist the estimate when it actually moved — get_list is a
+    # read path and shouldn't take the write lock for a no-op UPDATE
+    if total > 0 and total != lst.get("total_estimate"):
         db.update_list_status(list_id, lst["status"], total_estimate=total)
 
     return {"list": lst, "items": items, "stats": stats, "total_estimate": total}
@@ -130,46 +133,61 @@ def resolve_list_items(list_id: int) -> dict:
 
 
 def _resolve_list_items(list_id: int, items: list[dict]) -> dict:
-    """Internal: resolve unresolved items in a list."""
+    """Internal: resolve unresolved items in a list.
+
+    Pending items go through resolver.resolve_list as one batch — one
+    preference load and concurrent deduplicated searches — and the
+    write-backs share a single transaction.
+    """
     resolved = 0
-    already_resolved = 0
     unresolved = 0
     disambiguation_needed = []
 
-    for item in items:
-        if item["resolved"]:
-            already_resolved += 1
-            continue
-
-        result = resolve_item(item["generic_name"])
-
-        if result["resolved"] and result["product"]:
-            product = result["product"]
-            db.update_list_item(
-                item["id"],
-                stockcode=product.get("stockcode"),
-                product_name=product.get("name"),
-                price=product.get("price"),
-                resolved=1,
-            )
-            resolved += 1
-        elif result["candidates"]:
-            disambiguation_needed.append({
-                "item": item["generic_name"],
-                "candidates": [
-                    {
-                        "stockcode": c.get("stockcode"),
-                        "name": c.get("name"),
-                        "brand": c.get("brand", ""),
-                        "price": c.get("price"),
-                        "package_size": c.get("package_size", ""),
-                    }
-                    for c in result["candidates"][:3]
-                ],
-            })
-            unresolved += 1
-        else:
-            unresolved += 1
+    pending = [item for item in items if not item["resolved"]]
+    already_resolved = len(items) - len(pending)
+
+    results = resolve_list(
+        [{"generic_name": i["generic_name"], "quantity": i.get("quantity", 1)}
+         for i in pending]
+    ) if pending else []
+
+    to_write = []
+    with db.transaction():
+        for item, result in zip(pending, results):
+            if result["resolved"] and result["product"]:
+                product = result["product"]
+                fields = {
+                    "stockcode": product.get("stockcode"),
+                    "product_name": product.get("name"),
+                    "price": product.get("price"),
+                    "resolved": 1,
+                }
+                to_write.append((fields["stockcode"], fields["product_name"],
+                                 fields["price"], item["id"]))
+                # Mirror the write into the caller's dict so get_list doesn't
+                # have to re-read the whole list
+                item.update(fields)
+                resolved += 1
+            elif result["candidates"]:
+                disambiguation_needed.append({
+                    "item": item["generic_name"],
+                    "candidates": [
+                        {
+                            "stockcode": c.get("stockcode"),
+                            "name": c.get("name"),
+                            "brand": c.get("brand", ""),
+                            "price": c.get("price"),
+                            "package_size": c.get("package_size", ""),
+                        }
+                        for c in result["candidates"][:3]
+                    ],
+                })
+                unresolved += 1
+            else:
+                unresolved += 1
+
+        if to_write:
+            db.resolve_list_items_bulk(to_write)
 
     return {
         "total": len(items),
@@ -192,79 +210,87 @@ def mark_purchased(list_id: int, total_paid: Optional[float] = None,
         raise ValueError(f"List {list_id} not found")
 
     items = db.get_list_items(list_id)
-    total_estimate = sum(
-        (i.get("price") or 0) * i.get("quantity", 1)
-        for i in items
-    )
-
-    # Create order
-    order_id = db.create_order(
-        list_id=list_id,
-        total_estimate=total_estimate if total_estimate > 0 else None,
-        total_paid=total_paid,
-        item_count=len(items),
-        notes=notes,
-    )
-
-    # Log each item to order_items
-    items_logged = 0
-    for item in items:
-        if item.get("stockcode"):
-            db.add_order_item(
-                order_id=order_id,
-                generic_name=item["generic_name"],
-                stockcode=item["stockcode"],
-                product_name=item.get("product_name"),
-                brand=None,  # TODO: could track brand in list_items
-                quantity=item.get("quantity", 1),
-                price=item.get("price"),
-                on_special=False,
-            )
-
-            # Update preference purchase count
-            db.save_preference(
-                generic_name=item["generic_name"],
-                stockcode=item["stockcode"],
-                product_name=item.get("product_name") or item["generic_name"],
-                price=item.get("price"),
-            )
-
-            # Record price history
-            if item.get("price") is not None:
-                db.record_price(
-                    stockcode=item["stockcode"],
-                    product_name=item.get("product_name") or item["generic_name"],
-                    price=item["price"],
-                )
 
-            items_logged += 1
+    # Repeat weekly shops mostly see unchanged prices — only record a
+    # history row when the price moved from the last observation
+    last_prices = db.get_latest_prices()
 
-    # Mark list as purchased
-    db.update_list_status(list_id, "purchased", total_estimate=total_estimate)
-
-    return {"order_id": order_id, "items_logged": items_logged}
+    # One pass over the items collects the line totals and builds the
+    # order/preference/price batches
+    order_item_rows = []
+    pref_rows = []
+    price_rows = []
+    line_totals = []
+    for item in items:
+        price = item.get("price")
+        quantity = item.get("quantity", 1)
+        if price is not None:
+            line_totals.append(price * quantity)
+        if not item.get("stockcode"):
+            continue
+        name = item["generic_name"]
+        product = item.get("product_name") or name
+        # brand is None — TODO: could track brand in list_items
+        order_item_rows.append((name, item["stockcode"], item.get("product_name"),
+                                None, quantity, price, 0))
+        pref_rows.append((name, item["stockcode"], product, None, None, price))
+        if price is not None and last_prices.get(item["stockcode"]) != price:
+            price_rows.append((item["stockcode"], product, price, 0))
+    total_estimate = math.fsum(line_totals)
+
+    # One transaction: the order, its items, preference counts, price
+    # history and the status flip all land in a single commit
+    with db.transaction():
+        order_id = db.create_order(
+            list_id=list_id,
+            total_estimate=total_estimate if total_estimate > 0 else None,
+            total_paid=total_paid,
+            item_count=len(items),
+            notes=notes,
+        )
+        if order_item_rows:
+            db.add_order_items(order_id, order_item_rows)
+            db.save_preferences_bulk(pref_rows)
+        if price_rows:
+            db.record_prices(price_rows)
+        db.update_list_status(list_id, "purchased", total_estimate=total_estimate)
+
+    return {"order_id": order_id, "items_logged": len(order_item_rows)}
+
+
+# Leading quantity ("2 milk"), trailing quantity ("milk x3", "milk x 3"),
+# or bare name — one anchored match instead of split/int/rsplit attempts
+_ITEM_RE = re.compile(r"^\s*(?:(\d+)\s+)?(.+?)(?:\s+[xX]\s*(\d+))?\s*$")
+# The batch variant scans newline-joined input under MULTILINE, so its
+# whitespace must stop at line ends — [^\S\n] is \s minus \n. Plain \s
+# would let a bare-numeric line donate its digits to the next item.
+_ITEM_RE_M = re.compile(
+    r"^[^\S\n]*(?:(\d+)[^\S\n]+)?(.+?)(?:[^\S\n]+[xX][^\S\n]*(\d+))?[^\S\n]*$",
+    re.MULTILINE)
+
+
+def _parse_items_batch(strings: list[str]) -> list[tuple[str, int]]:
+    """Parse many item strings in one regex pass.
+
+    Joining on newlines lets a single finditer call tokenize the whole
+    batch inside the C regex engine instead of one match per string.
+    Blank strings produce no line to match and are dropped.
+    """
+    return [
+        (m.group(2).lower(), int(m.group(1) or m.group(3) or 1))
+        for m in _ITEM_RE_M.finditer("\n".join(strings))
+    ]
 
 
 def _parse_item_string(item_str: str) -> tuple[str, int]:
     """Parse an item string like '2 milk' or 'bread' into (name, quantity)."""
-    item_str = item_str.strip()
-    parts = item_str.split(None, 1)
-
-    if len(parts) == 2:
-        try:
-            quantity = int(parts[0])
-            return parts[1].lower().strip(), quantity
-        except ValueError:
-            pass
-
-    # Check for trailing quantity like "milk x3" or "milk x 3"
-    if " x" in item_str.lower():
-        parts = item_str.lower().rsplit(" x", 1)
-        if len(parts) == 2:
-            try:
-                quantity = int(parts[1].strip())
-                return parts[0].strip(), quantity
-            except ValueError:
-                pass
-
-    return item_str.lower().strip(), 1
+    s = item_str.strip()
+    # A quantity needs a leading digit or an x marker; plain names — the
+    # common case — skip the regex entirely
+    if s and not s[0].isdigit() and "x" not in s and "X" not in s:
+        return s.lower(), 1
+    m = _ITEM_RE.match(item_str)
+    if not m or not m.group(2):
+        return item_str.lower().strip(), 1
+    quantity = int(m.group(1) or m.group(3) or 1)
+    return m.group(2).lower(), quantity
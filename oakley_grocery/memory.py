@@ -7,6 +7,16 @@ from typing import Optional
 from oakley_grocery import db
 from oakley_grocery.common.config import Config
 
+# Hoisted so repeated calls hand sqlite3's per-connection statement cache
+# the identical SQL text instead of re-building the string each call
+_PURCHASE_FREQ_SQL = """SELECT COUNT(DISTINCT order_id) as order_count,
+                  SUM(quantity) as total_qty,
+                  AVG(price) as avg_price,
+                  MAX(price) as max_price,
+                  MIN(price) as min_price
+           FROM order_items
+           WHERE generic_name = ?"""
+
 
 def build_usual(min_frequency: int = 0, lookback_orders: int = 0,
                 exclude: Optional[list[str]] = None) -> list[dict]:
@@ -41,16 +51,12 @@ def suggest_additions(list_id: int) -> list[dict]:
     Returns:
         list of usual items not present in the given list
     """
-    list_items = db.get_list_items(list_id)
-    current_items = {item["generic_name"] for item in list_items}
-
-    usual = build_usual()
-    suggestions = [
-        item for item in usual
-        if item["generic_name"] not in current_items
-    ]
-
-    return suggestions
+    # The anti-join in SQL replaces loading the list and diffing in Python
+    return db.get_frequent_items(
+        min_orders=Config.default_usual_min_frequency,
+        lookback=Config.default_usual_lookback_orders,
+        exclude_list_id=list_id,
+    )
 
 
 def get_purchase_frequency(generic_name: str) -> dict:
@@ -64,13 +70,7 @@ def get_purchase_frequency(generic_name: str) -> dict:
 
     # Count orders containing this item
     row = conn.execute(
-        """SELECT COUNT(DISTINCT order_id) as order_count,
-                  SUM(quantity) as total_qty,
-                  AVG(price) as avg_price,
-                  MAX(price) as max_price,
-                  MIN(price) as min_price
-           FROM order_items
-           WHERE generic_name = ?""",
+        _PURCHASE_FREQ_SQL,
         (generic_name.lower().strip(),),
     ).fetchone()
 
@@ -100,26 +100,8 @@ def get_spending_summary(period_days: int = 30) -> dict:
         {"period_days": int, "order_count": int, "total_spent": float,
          "avg_order": float, "top_items": list[dict]}
     """
-    stats = db.get_spending_stats(days=period_days)
-
-    # Get top items by spend in period
-    conn = db._get_conn()
-    rows = conn.execute(
-        """SELECT oi.generic_name,
-                  SUM(oi.quantity) as total_qty,
-                  SUM(oi.price * oi.quantity) as total_spend,
-                  COUNT(DISTINCT oi.order_id) as appearances
-           FROM order_items oi
-           JOIN orders o ON oi.order_id = o.id
-           WHERE o.created_at >= datetime('now', ? || ' days')
-             AND oi.price IS NOT NULL
-           GROUP BY oi.generic_name
-           ORDER BY total_spend DESC
-           LIMIT 10""",
-        (f"-{period_days}",),
-    ).fetchall()
-
-    top_items = [dict(r) for r in rows]
+    # Summary stats and top items come back from a single query
+    stats = db.get_spending_summary_all(days=period_days)
 
     return {
         "period_days": period_days,
@@ -128,5 +110,5 @@ def get_spending_summary(period_days: int = 30) -> dict:
         "avg_order": stats.get("avg_order", 0),
         "max_order": stats.get("max_order", 0),
         "min_order": stats.get("min_order", 0),
-        "top_items": top_items,
+        "top_items": stats.get("top_items", []),
     }
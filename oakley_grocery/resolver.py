@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 from oakley_grocery import db, woolworths
 from oakley_grocery.common.config import Config
 
+# Hot-path constants hoisted out of per-call Config attribute lookups
+_AUTO_RESOLVE_MIN_SCORE = Config.auto_resolve_min_score
+_AUTO_RESOLVE_GAP = Config.auto_resolve_gap
 
-def _tokenize(text: str) -> set[str]:
-    """Split text into lowercase tokens for matching."""
-    return set(text.lower().split()) if text else set()
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset:
+    """Split text into lowercase tokens for matching.
+
+    Cached — the same product names and queries recur across resolve calls,
+    so repeat tokenizations become a dict hit.
+    """
+    return frozenset(text.lower().split()) if text else frozenset()
 
 
 def _jaccard(a: set, b: set) -> float:
@@ -22,11 +32,24 @@ def _jaccard(a: set, b: set) -> float:
     return intersection / union if union else 0.0
 
 
+# Sentinel distinguishing "no preference exists" from "caller didn't look one up"
+_PREF_UNSET = object()
+
+
 def _calculate_relevance(product: dict, generic_name: str,
                          prefer_brand: Optional[str] = None,
-                         prefer_size: Optional[str] = None) -> float:
+                         prefer_size: Optional[str] = None,
+                         query_tokens: Optional[set] = None,
+                         pref=_PREF_UNSET,
+                         _tokenize=_tokenize, _jaccard=_jaccard) -> float:
     """Score a product's relevance to a generic name. Returns 0.0-1.0.
 
+    Batch callers can pass a precomputed query_tokens set so the query is
+    tokenized once rather than once per candidate, and the already-fetched
+    preference row (or None) so scoring never touches the database.
+    The trailing defaults bind the tokenizer helpers as locals — this runs
+    once per candidate, so the global lookups add up.
+
     Weights:
     - Name token overlap (Jaccard): 40%
     - Brand match: 20%
@@ -36,16 +59,19 @@ def _calculate_relevance(product: dict, generic_name: str,
     - Availability penalty: halves score if unavailable
     """
     score = 0.0
+    get = product.get  # bound once — scoring reads several fields per call
 
     # Name overlap — 40%
-    query_tokens = _tokenize(generic_name)
-    name_tokens = _tokenize(product.get("name", ""))
+    if query_tokens is None:
+        query_tokens = _tokenize(generic_name)
+    name_tokens = _tokenize(get("name", ""))
     score += _jaccard(query_tokens, name_tokens) * 0.4
 
     # Brand match — 20%
     if prefer_brand:
-        product_brand = (product.get("brand") or "").lower()
-        if prefer_brand.lower() in product_brand or product_brand in prefer_brand.lower():
+        wanted_brand = prefer_brand.lower()
+        product_brand = (get("brand") or "").lower()
+        if wanted_brand in product_brand or product_brand in wanted_brand:
             score += 0.2
         elif product_brand:
             # Partial brand token match
@@ -54,145 +80,191 @@ def _calculate_relevance(product: dict, generic_name: str,
 
     # Size match — 15%
     if prefer_size:
-        product_size = (product.get("package_size") or "").lower()
-        if prefer_size.lower() in product_size or product_size in prefer_size.lower():
+        wanted_size = prefer_size.lower()
+        product_size = (get("package_size") or "").lower()
+        if wanted_size in product_size or product_size in wanted_size:
             score += 0.15
 
     # Purchase history — 15%
-    pref = db.get_preference(generic_name)
-    if pref and pref.get("stockcode") == product.get("stockcode"):
+    if pref is _PREF_UNSET:
+        pref = db.get_preference(generic_name)
+    if pref and pref.get("stockcode") == get("stockcode"):
         frequency_bonus = min(pref.get("purchase_count", 0) / 10, 1.0)
         score += frequency_bonus * 0.15
 
     # On special bonus — 5%
-    if product.get("on_special"):
+    if get("on_special"):
         score += 0.05
 
     # Availability penalty
-    if not product.get("available", True):
+    if not get("available", True):
         score *= 0.5
 
     return min(score, 1.0)
 
 
-def resolve_item(generic_name: str, quantity: int = 1,
-                 prefer_brand: Optional[str] = None,
-                 prefer_size: Optional[str] = None) -> dict:
-    """Resolve a generic item name to a specific Woolworths product.
+def _preference_result(pref: dict, generic: str, quantity: int) -> dict:
+    """Build a resolved result from a saved preference row."""
+    return {
+        "resolved": True,
+        "product": {
+            "stockcode": pref["stockcode"],
+            "name": pref["product_name"],
+            "brand": pref.get("brand"),
+            "package_size": pref.get("package_size"),
+            "price": pref.get("last_price"),
+        },
+        "candidates": [],
+        "source": "preference",
+        "generic_name": generic,
+        "quantity": quantity,
+    }
 
-    Returns:
-        {
-            "resolved": bool,
-            "product": dict or None,
-            "candidates": list[dict],
-            "source": "preference"|"search"|"unresolved",
-            "generic_name": str,
-            "quantity": int,
-        }
-    """
-    generic = generic_name.lower().strip()
 
+def _unresolved_result(generic: str, quantity: int,
+                       candidates: Optional[list] = None) -> dict:
+    return {
+        "resolved": False,
+        "product": None,
+        "candidates": candidates or [],
+        "source": "unresolved",
+        "generic_name": generic,
+        "quantity": quantity,
+    }
+
+
+def _resolve_from_preferences(generic: str, quantity: int,
+                              prefs_by_name: Optional[dict] = None) -> Optional[dict]:
+    """Steps 1-2: exact then fuzzy preference match. Returns a result or None."""
     # 1. Exact preference match
-    pref = db.get_preference(generic)
+    if prefs_by_name is not None:
+        pref = prefs_by_name.get(generic)
+    else:
+        pref = db.get_preference(generic)
     if pref:
-        return {
-            "resolved": True,
-            "product": {
-                "stockcode": pref["stockcode"],
-                "name": pref["product_name"],
-                "brand": pref.get("brand"),
-                "package_size": pref.get("package_size"),
-                "price": pref.get("last_price"),
-            },
-            "candidates": [],
-            "source": "preference",
-            "generic_name": generic,
-            "quantity": quantity,
-        }
+        return _preference_result(pref, generic, quantity)
 
     # 2. Fuzzy preference match — check if any saved preferences overlap
-    all_prefs = db.get_all_preferences()
+    if prefs_by_name is not None:
+        all_prefs = prefs_by_name.values()
+    else:
+        all_prefs = db.get_all_preferences()
+    query_tokens = _tokenize(generic)
     for p in all_prefs:
-        pref_tokens = _tokenize(p["generic_name"])
-        query_tokens = _tokenize(generic)
+        pref_tokens = p.get("_tokens") or _tokenize(p["generic_name"])
         overlap = _jaccard(query_tokens, pref_tokens)
         if overlap >= 0.6:
-            return {
-                "resolved": True,
-                "product": {
-                    "stockcode": p["stockcode"],
-                    "name": p["product_name"],
-                    "brand": p.get("brand"),
-                    "package_size": p.get("package_size"),
-                    "price": p.get("last_price"),
-                },
-                "candidates": [],
-                "source": "preference",
-                "generic_name": generic,
-                "quantity": quantity,
-            }
+            return _preference_result(p, generic, quantity)
 
-    # 3. Woolworths search + rank
-    try:
-        search_query = generic
-        if prefer_brand:
-            search_query = f"{prefer_brand} {generic}"
-        if prefer_size:
-            search_query = f"{search_query} {prefer_size}"
+    return None
 
-        products = woolworths.search_products(search_query, page_size=10)
-    except RuntimeError:
-        return {
-            "resolved": False,
-            "product": None,
-            "candidates": [],
-            "source": "unresolved",
-            "generic_name": generic,
-            "quantity": quantity,
-        }
 
-    if not products:
-        return {
-            "resolved": False,
-            "product": None,
-            "candidates": [],
-            "source": "unresolved",
-            "generic_name": generic,
-            "quantity": quantity,
-        }
-
-    # Score each product
-    scored = []
-    for p in products:
-        score = _calculate_relevance(p, generic, prefer_brand, prefer_size)
-        scored.append({**p, "_score": score})
+def _build_search_query(generic: str, prefer_brand: Optional[str],
+                        prefer_size: Optional[str]) -> str:
+    search_query = generic
+    if prefer_brand:
+        search_query = f"{prefer_brand} {generic}"
+    if prefer_size:
+        search_query = f"{search_query} {prefer_size}"
+    return search_query
 
-    scored.sort(key=lambda x: x["_score"], reverse=True)
 
-    top = scored[0]
-    second = scored[1] if len(scored) > 1 else None
+def _rank_search_results(products: list[dict], generic: str, quantity: int,
+                         prefer_brand: Optional[str] = None,
+                         prefer_size: Optional[str] = None) -> dict:
+    """Steps 3-4: score candidates and auto-resolve or disambiguate."""
+    if not products:
+        return _unresolved_result(generic, quantity)
+
+    # Score each product — tokenize the query once for the whole batch.
+    # Scores live in a parallel list so candidates aren't dict-copied just
+    # to carry a score; only the returned top-5 get "_score" attached.
+    # (No preference exists for this generic — steps 1-2 already checked.)
+    query_tokens = _tokenize(generic)
+    scores = [
+        _calculate_relevance(p, generic, prefer_brand, prefer_size,
+                             query_tokens=query_tokens, pref=None)
+        for p in products
+    ]
+
+    order = sorted(range(len(products)), key=scores.__getitem__, reverse=True)
+    candidates = [{**products[i], "_score": scores[i]} for i in order[:5]]
 
     # 4. Auto-resolve vs disambiguate
-    gap = (top["_score"] - second["_score"]) if second else 1.0
+    top_score = scores[order[0]]
+    gap = (top_score - scores[order[1]]) if len(order) > 1 else 1.0
 
-    if top["_score"] >= Config.auto_resolve_min_score and gap >= Config.auto_resolve_gap:
+    if top_score >= _AUTO_RESOLVE_MIN_SCORE and gap >= _AUTO_RESOLVE_GAP:
         return {
             "resolved": True,
-            "product": top,
-            "candidates": scored[:5],
+            "product": candidates[0],
+            "candidates": candidates,
             "source": "search",
             "generic_name": generic,
             "quantity": quantity,
         }
 
-    return {
-        "resolved": False,
-        "product": None,
-        "candidates": scored[:5],
-        "source": "unresolved",
-        "generic_name": generic,
-        "quantity": quantity,
-    }
+    return _unresolved_result(generic, quantity, candidates=candidates)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(generic: str) -> dict:
+    """Resolve a normalized name with no brand/size hints, memoized.
+
+    Repeat lookups of staples ("milk", "bread") within one process hit
+    the cache instead of re-running the preference scan and search.
+    Cleared whenever a preference is saved so new learning takes effect.
+    """
+    result = _resolve_from_preferences(generic, 1)
+    if result is not None:
+        return result
+    try:
+        products = woolworths.search_products(
+            _build_search_query(generic, None, None), page_size=10)
+    except RuntimeError:
+        return _unresolved_result(generic, 1)
+    return _rank_search_results(products, generic, 1)
+
+
+def resolve_item(generic_name: str, quantity: int = 1,
+                 prefer_brand: Optional[str] = None,
+                 prefer_size: Optional[str] = None,
+                 prefs_by_name: Optional[dict] = None) -> dict:
+    """Resolve a generic item name to a specific Woolworths product.
+
+    Batch callers (resolve_list) pass prefs_by_name — a preloaded
+    {generic_name: preference} map — so each item costs zero extra
+    preference queries.
+
+    Returns:
+        {
+            "resolved": bool,
+            "product": dict or None,
+            "candidates": list[dict],
+            "source": "preference"|"search"|"unresolved",
+            "generic_name": str,
+            "quantity": int,
+        }
+    """
+    generic = generic_name.lower().strip()
+
+    # The hint-free call is the common shape and fully memoizable; the
+    # copy keeps per-call quantity out of the shared cached dict
+    if prefer_brand is None and prefer_size is None and prefs_by_name is None:
+        return {**_resolve_cached(generic), "quantity": quantity}
+
+    result = _resolve_from_preferences(generic, quantity, prefs_by_name)
+    if result is not None:
+        return result
+
+    # 3. Woolworths search + rank
+    try:
+        products = woolworths.search_products(
+            _build_search_query(generic, prefer_brand, prefer_size), page_size=10)
+    except RuntimeError:
+        return _unresolved_result(generic, quantity)
+
+    return _rank_search_results(products, generic, quantity, prefer_brand, prefer_size)
 
 
 def resolve_list(items: list[dict]) -> list[dict]:
@@ -200,16 +272,43 @@ def resolve_list(items: list[dict]) -> list[dict]:
 
     Each item should have at least: {"generic_name": str}
     Optional: quantity, prefer_brand, prefer_size
+
+    Items that miss the preference store are searched concurrently, with
+    duplicate queries deduplicated, so batch wall time is bounded by the
+    rate limit rather than per-item round-trips.
     """
-    results = []
+    # Load preferences once for the whole batch, with token sets computed
+    # up front so the fuzzy loop never re-tokenizes a preference
+    all_prefs = db.get_all_preferences()
+    for p in all_prefs:
+        p["_tokens"] = _tokenize(p["generic_name"])
+    prefs_by_name = {p["generic_name"]: p for p in all_prefs}
+
+    results: list[Optional[dict]] = []
+    pending = []  # (index, generic, quantity, prefer_brand, prefer_size, query)
     for item in items:
-        result = resolve_item(
-            generic_name=item["generic_name"],
-            quantity=item.get("quantity", 1),
-            prefer_brand=item.get("prefer_brand"),
-            prefer_size=item.get("prefer_size"),
-        )
+        generic = item["generic_name"].lower().strip()
+        quantity = item.get("quantity", 1)
+        result = _resolve_from_preferences(generic, quantity, prefs_by_name)
+        if result is None:
+            pending.append((len(results), generic, quantity,
+                            item.get("prefer_brand"), item.get("prefer_size")))
         results.append(result)
+
+    if pending:
+        # Dedupe queries, then fetch concurrently through the network layer
+        unique = {_build_search_query(generic, prefer_brand, prefer_size)
+                  for _, generic, _, prefer_brand, prefer_size in pending}
+        fetched = woolworths.search_many(list(unique), page_size=10)
+
+        for index, generic, quantity, prefer_brand, prefer_size in pending:
+            products = fetched[_build_search_query(generic, prefer_brand, prefer_size)]
+            if products is None:
+                results[index] = _unresolved_result(generic, quantity)
+            else:
+                results[index] = _rank_search_results(
+                    products, generic, quantity, prefer_brand, prefer_size)
+
     return results
 
 
@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is the fallback
+    orjson = None
 
 from oakley_grocery.common.config import Config
 from oakley_grocery.common.cache import FileCache
@@ -17,9 +28,17 @@ _limiter = RateLimiter(
     period=Config.woolworths_rate_limit_period,
 )
 
+# Only advertise brotli if urllib3 can actually decode it
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, br, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 _HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Accept": "application/json, text/plain, */*",
+    "Accept-Encoding": _ACCEPT_ENCODING,
     "Accept-Language": "en-AU,en;q=0.9",
     "Content-Type": "application/json",
     "Origin": Config.woolworths_base_url,
@@ -27,6 +46,63 @@ _HEADERS = {
 }
 
 _session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Negative-cache TTLs — empty result pages and endpoint failures are
+# remembered briefly so repeat calls don't burn rate-limit tokens on a
+# query that just failed (bot-manager 403s tend to come in bursts)
+_EMPTY_RESULT_TTL = 30
+_ERROR_TTL = 60
+
+# In-flight fetches keyed by cache key — concurrent identical misses wait
+# on the first caller's result instead of spending a second rate-limit token
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: str, fetch: Callable):
+    """Run fetch() once per key; concurrent callers share the result."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            owned = False
+        else:
+            future = _inflight[key] = Future()
+            owned = True
+
+    if not owned:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _loads(resp: requests.Response):
+    """Parse a response body — orjson skips requests' charset detection and
+    is markedly faster on the large search/specials bundles."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    # Woolworths always returns UTF-8 — pinning the encoding stops
+    # resp.json() running charset detection over the whole body
+    if resp.encoding is None:
+        resp.encoding = "utf-8"
+    return resp.json()
+
+
+def _dumps(payload: dict) -> bytes:
+    """Serialize an outgoing payload to bytes (Content-Type is set in _HEADERS)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
 
 
 def _get_session() -> requests.Session:
@@ -39,19 +115,45 @@ def _get_session() -> requests.Session:
     if _session is not None:
         return _session
 
-    _session = requests.Session()
-    _session.headers.update(_HEADERS)
+    # warmup() races the first real call here — build the session once
+    with _session_lock:
+        if _session is not None:
+            return _session
+        return _build_session()
+
+
+def _build_session() -> requests.Session:
+    global _session
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+
+    # Pooled keep-alive connections sized for the concurrent cart-build
+    # workers, with retries on transient gateway/throttle responses
+    session.mount("https://", HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+        ),
+    ))
+    session.headers["Connection"] = "keep-alive"
 
     # Hit homepage to acquire bot-manager cookies
     try:
-        _session.get(
+        session.get(
             f"{Config.woolworths_base_url}/",
             timeout=Config.request_timeout,
         )
     except requests.RequestException:
         pass  # Proceed anyway — might still work from cache
 
-    return _session
+    # Publish only once warm, so the unlocked fast path in _get_session
+    # never hands out a session mid-handshake
+    _session = session
+    return session
 
 
 def _reset_session() -> None:
@@ -60,31 +162,35 @@ def _reset_session() -> None:
     _session = None
 
 
-def _parse_product(raw: dict) -> dict:
-    """Normalise a Woolworths product response into a clean dict."""
-    price = raw.get("Price") or raw.get("InstorePrice")
-    was_price = raw.get("WasPrice")
-    on_special = raw.get("IsOnSpecial", False) or raw.get("IsInStoreSpecial", False)
+def warmup() -> None:
+    """Acquire bot-manager cookies in the background.
+
+    Callers that know a search is coming (CLI startup) can fire this so
+    the homepage handshake overlaps with their own setup instead of
+    blocking the first real request.
+    """
+    threading.Thread(target=_get_session, daemon=True).start()
 
-    cup_price_str = raw.get("CupString", "")
-    cup_price = raw.get("CupPrice")
 
-    package_size = raw.get("PackageSize", "") or raw.get("Unit", "")
+def _parse_product(raw: dict) -> dict:
+    """Normalise a Woolworths product response into a clean dict."""
+    g = raw.get  # bound once — this runs per product across full result pages
+    on_special = g("IsOnSpecial", False) or g("IsInStoreSpecial", False)
 
     return {
-        "stockcode": raw.get("Stockcode"),
-        "name": raw.get("Name", raw.get("DisplayName", "")),
-        "brand": raw.get("Brand", ""),
-        "price": price,
-        "was_price": was_price if on_special else None,
-        "cup_price": cup_price,
-        "cup_string": cup_price_str,
-        "package_size": package_size,
-        "available": raw.get("IsAvailable", True),
+        "stockcode": g("Stockcode"),
+        "name": g("Name", g("DisplayName", "")),
+        "brand": g("Brand", ""),
+        "price": g("Price") or g("InstorePrice"),
+        "was_price": g("WasPrice") if on_special else None,
+        "cup_price": g("CupPrice"),
+        "cup_string": g("CupString", ""),
+        "package_size": g("PackageSize", "") or g("Unit", ""),
+        "available": g("IsAvailable", True),
         "on_special": on_special,
-        "image_url": raw.get("MediumImageFile", raw.get("SmallImageFile", "")),
-        "aisle": raw.get("Aisle", ""),
-        "description": raw.get("Description", ""),
+        "image_url": g("MediumImageFile", g("SmallImageFile", "")),
+        "aisle": g("Aisle", ""),
+        "description": g("Description", ""),
     }
 
 
@@ -98,75 +204,128 @@ def search_products(query: str, page: int = 1, page_size: int = 0,
 
     cache_key = f"search_{query}_{page}_{page_size}_{sort_by}"
     cached = _cache.get(cache_key, ttl=Config.cache_ttl["search"])
-    if cached:
+    if cached is not None:
         return cached
 
-    _limiter.acquire()
-    session = _get_session()
-
-    payload = {
-        "SearchTerm": query,
-        "PageNumber": page,
-        "PageSize": page_size,
-        "SortType": sort_by,
-        "Location": "",
-        "IsSpecial": False,
-    }
-
-    try:
-        resp = session.post(
-            Config.woolworths_search_url,
-            json=payload,
-            timeout=Config.request_timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        # Reset session and try stale cache
-        _reset_session()
-        stale = _cache.get(cache_key)
-        if stale:
-            return stale
-        raise RuntimeError(f"Woolworths search failed: {e}") from e
-
-    products = []
-    bundles = data.get("Products", [])
-    for bundle in bundles:
-        items = bundle.get("Products", [])
-        for item in items:
-            products.append(_parse_product(item))
+    neg = _cache.get(f"neg_{cache_key}")
+    if neg:
+        raise RuntimeError(f"Woolworths search failed: {neg['__error__']}")
+
+    def _fetch() -> list[dict]:
+        _limiter.acquire()
+        session = _get_session()
+
+        payload = {
+            "SearchTerm": query,
+            "PageNumber": page,
+            "PageSize": page_size,
+            "SortType": sort_by,
+            "Location": "",
+            "IsSpecial": False,
+        }
+
+        try:
+            resp = session.post(
+                Config.woolworths_search_url,
+                data=_dumps(payload),
+                timeout=Config.request_timeout,
+            )
+            resp.raise_for_status()
+            data = _loads(resp)
+        except requests.RequestException as e:
+            # Reset session and try stale cache
+            _reset_session()
+            stale = _cache.get(cache_key)
+            if stale:
+                return stale
+            _cache.set(f"neg_{cache_key}", {"__error__": str(e)}, ttl=_ERROR_TTL)
+            raise RuntimeError(f"Woolworths search failed: {e}") from e
+
+        parse = _parse_product  # local bind — one global lookup per page, not per item
+        products = [
+            parse(item)
+            for item in chain.from_iterable(
+                bundle.get("Products", ()) for bundle in data.get("Products", ()))
+        ]
+
+        if products:
+            _cache.set(cache_key, products)
+        else:
+            _cache.set(cache_key, [], ttl=_EMPTY_RESULT_TTL)
+        return products
+
+    return _single_flight(cache_key, _fetch)
+
+
+def search_many(queries: list[str], page_size: int = 0,
+                max_workers: int = 5) -> dict[str, Optional[list]]:
+    """Fetch several search queries concurrently over the shared session pool.
+
+    Multi-query workflows (batch resolution, connection tests) overlap
+    their round-trips this way; the shared RateLimiter still enforces the
+    global requests/sec cap across workers.
+
+    Returns {query: products} with None where a search failed.
+    """
+    def _one(query: str) -> Optional[list]:
+        try:
+            return search_products(query, page_size=page_size)
+        except RuntimeError:
+            return None
 
-    _cache.set(cache_key, products)
-    return products
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(queries, pool.map(_one, queries)))
 
 
 def get_product_details(stockcode: int) -> Optional[dict]:
     """Get detailed product info by stockcode."""
     cache_key = f"product_{stockcode}"
     cached = _cache.get(cache_key, ttl=Config.cache_ttl["product"])
-    if cached:
+    if cached and not (isinstance(cached, dict) and cached.get("_stale")):
         return cached
 
-    _limiter.acquire()
-    session = _get_session()
-
-    try:
-        resp = session.get(
-            f"{Config.woolworths_product_url}/{stockcode}",
-            timeout=Config.request_timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        _reset_session()
-        stale = _cache.get(cache_key)
-        if stale:
-            return stale
-        raise RuntimeError(f"Woolworths product detail failed: {e}") from e
-
-    product = _parse_product(data.get("Product", data))
-    _cache.set(cache_key, product)
-    return product
+    def _fetch() -> Optional[dict]:
+        # Expired entry — revalidate with the stored ETag so the CDN can
+        # answer 304 with no body instead of a full JSON download
+        cached_product, validators = _cache.revalidation(cache_key)
+        cond_headers = {}
+        if validators:
+            if validators.get("etag"):
+                cond_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                cond_headers["If-Modified-Since"] = validators["last_modified"]
+
+        _limiter.acquire()
+        session = _get_session()
+
+        try:
+            resp = session.get(
+                f"{Config.woolworths_product_url}/{stockcode}",
+                headers=cond_headers or None,
+                timeout=Config.request_timeout,
+            )
+            if resp.status_code == 304 and cached_product is not None:
+                _cache.touch(cache_key)
+                return cached_product
+            resp.raise_for_status()
+            data = _loads(resp)
+        except requests.RequestException as e:
+            _reset_session()
+            stale = _cache.get(cache_key)
+            if stale:
+                return stale
+            raise RuntimeError(f"Woolworths product detail failed: {e}") from e
+
+        product = _parse_product(data.get("Product", data))
+        new_validators = {
+            k: v for k, v in (("etag", resp.headers.get("ETag")),
+                              ("last_modified", resp.headers.get("Last-Modified")))
+            if v
+        }
+        _cache.set(cache_key, product, validators=new_validators or None)
+        return product
+
+    return _single_flight(cache_key, _fetch)
 
 
 def get_specials(page: int = 1, page_size: int = 20) -> list[dict]:
@@ -176,62 +335,92 @@ def get_specials(page: int = 1, page_size: int = 20) -> list[dict]:
     if cached:
         return cached
 
-    _limiter.acquire()
-    session = _get_session()
+    def _fetch() -> list[dict]:
+        _limiter.acquire()
+        session = _get_session()
+
+        payload = {
+            "SearchTerm": "",
+            "PageNumber": page,
+            "PageSize": page_size,
+            "SortType": "TraderRelevance",
+            "Location": "",
+            "IsSpecial": True,
+        }
+
+        try:
+            resp = session.post(
+                Config.woolworths_search_url,
+                data=_dumps(payload),
+                timeout=Config.request_timeout,
+            )
+            resp.raise_for_status()
+            data = _loads(resp)
+        except requests.RequestException as e:
+            _reset_session()
+            stale = _cache.get(cache_key)
+            if stale:
+                return stale
+            raise RuntimeError(f"Woolworths specials failed: {e}") from e
+
+        products = []
+        append = products.append
+        parse = _parse_product
+        for bundle in data.get("Products", []):
+            for item in bundle.get("Products", []):
+                # Check the raw flags before parsing — non-special items never
+                # get a normalised dict allocated just to be discarded
+                if not (item.get("IsOnSpecial") or item.get("IsInStoreSpecial")):
+                    continue
+                append(parse(item))
+
+        _cache.set(cache_key, products)
+        return products
+
+    return _single_flight(cache_key, _fetch)
 
-    payload = {
-        "SearchTerm": "",
-        "PageNumber": page,
-        "PageSize": page_size,
-        "SortType": "TraderRelevance",
-        "Location": "",
-        "IsSpecial": True,
-    }
 
-    try:
-        resp = session.post(
-            Config.woolworths_search_url,
-            json=payload,
-            timeout=Config.request_timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        _reset_session()
-        stale = _cache.get(cache_key)
-        if stale:
-            return stale
-        raise RuntimeError(f"Woolworths specials failed: {e}") from e
+# ─── Trolley (cart) operations — require cookies ─────────────────────────────
 
-    products = []
-    bundles = data.get("Products", [])
-    for bundle in bundles:
-        items = bundle.get("Products", [])
-        for item in items:
-            parsed = _parse_product(item)
-            if parsed.get("on_special"):
-                products.append(parsed)
+_trolley_session: Optional[requests.Session] = None
+_trolley_cookies: Optional[str] = None
 
-    _cache.set(cache_key, products)
-    return products
 
+def _get_trolley_session() -> requests.Session:
+    """Get or create a pooled session with cookie auth for trolley operations.
 
-# ─── Trolley (cart) operations — require cookies ─────────────────────────────
+    Cart builds fire one request per item — keeping a dedicated session means
+    the TCP+TLS handshake is paid once and the Cookie header is set once,
+    not rebuilt per call. The session is keyed on the cookie string, so a
+    cookie refresh via setup gets a fresh session automatically.
+    """
+    global _trolley_session, _trolley_cookies
 
-def _get_trolley_headers() -> dict:
-    """Build headers with cookie auth for trolley operations."""
     cookies = auth.get_woolworths_cookies()
     if not cookies:
         raise RuntimeError("Woolworths cookies not configured. Run: oakley-grocery setup --woolworths-cookies COOKIES")
-    headers = dict(_HEADERS)
-    headers["Cookie"] = cookies
-    return headers
+
+    if _trolley_session is not None and cookies == _trolley_cookies:
+        return _trolley_session
+
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    session.headers["Cookie"] = cookies
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ))
+
+    _trolley_cookies = cookies
+    _trolley_session = session
+    return session
 
 
 def add_to_trolley(stockcode: int, quantity: int = 1) -> dict:
     """Add a product to the Woolworths trolley. Returns API response."""
     _limiter.acquire()
-    headers = _get_trolley_headers()
+    session = _get_trolley_session()
 
     payload = {
         "Stockcode": stockcode,
@@ -239,14 +428,13 @@ def add_to_trolley(stockcode: int, quantity: int = 1) -> dict:
     }
 
     try:
-        resp = requests.post(
+        resp = session.post(
             Config.woolworths_trolley_url,
-            json=payload,
-            headers=headers,
+            data=_dumps(payload),
             timeout=Config.request_timeout,
         )
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp)
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to add to trolley: {e}") from e
 
@@ -259,16 +447,15 @@ def get_trolley() -> dict:
         return cached
 
     _limiter.acquire()
-    headers = _get_trolley_headers()
+    session = _get_trolley_session()
 
     try:
-        resp = requests.get(
+        resp = session.get(
             Config.woolworths_trolley_list_url,
-            headers=headers,
             timeout=Config.request_timeout,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp)
     except requests.RequestException as e:
         stale = _cache.get(cache_key)
         if stale:
@@ -5,32 +5,51 @@ import sqlite3
 import tempfile
 import pytest
 
+import oakley_grocery.common.config as cfg
+from oakley_grocery import db
 
-@pytest.fixture(autouse=True)
-def temp_db(tmp_path, monkeypatch):
-    """Use a temporary database for each test."""
-    monkeypatch.setenv("OAKLEY_GROCERY_DATA_DIR", str(tmp_path))
-    # Force reimport to pick up new data dir
-    import oakley_grocery.common.config as cfg
+
+# One DELETE per table, one commit — resets state without re-running DDL
+RESET_SQL = """
+    BEGIN;
+    DELETE FROM list_items; DELETE FROM order_items;
+    DELETE FROM orders; DELETE FROM lists;
+    DELETE FROM preferences; DELETE FROM price_history;
+    COMMIT;
+"""
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Build one database for the module; tests share it and reset between."""
+    tmp_path = tmp_path_factory.mktemp("db")
     cfg.DATA_DIR = tmp_path
     cfg.CACHE_DIR = tmp_path / "cache"
-    cfg.DB_PATH = tmp_path / "grocery.db"
+    cfg.DB_PATH = ":memory:"  # semantics only — no fsync, no file
     cfg.CONFIG_PATH = tmp_path / "config.json"
     cfg.Config.data_dir = cfg.DATA_DIR
     cfg.Config.cache_dir = cfg.CACHE_DIR
     cfg.Config.db_path = cfg.DB_PATH
     cfg.Config.config_path = cfg.CONFIG_PATH
 
-    import oakley_grocery.db as db_mod
-    db_mod._conn = None  # Reset connection
+    db._conn = None  # Reset connection
     yield tmp_path
-    db_mod._conn = None
+    if db._conn is not None:
+        db._conn.close()
+    db._conn = None
+
+
+@pytest.fixture(autouse=True)
+def reset_db(temp_db):
+    """Empty every table after each test — schema setup runs once per module."""
+    yield
+    db._get_conn().executescript(RESET_SQL)
+    db._get_preference_cached.cache_clear()
 
 
 # ─── Preferences ─────────────────────────────────────────────────────────────
 
 def test_save_preference_new():
-    from oakley_grocery import db
     row_id = db.save_preference("milk", 12345, "Pauls Full Cream 2L", "Pauls", "2L", 4.50)
     assert row_id > 0
 
@@ -44,7 +63,6 @@ def test_save_preference_new():
 
 
 def test_save_preference_updates():
-    from oakley_grocery import db
     db.save_preference("milk", 12345, "Pauls Full Cream 2L", "Pauls", "2L", 4.50)
     db.save_preference("milk", 12345, "Pauls Full Cream 2L", "Pauls", "2L", 4.75)
 
@@ -54,7 +72,6 @@ def test_save_preference_updates():
 
 
 def test_save_preference_case_insensitive():
-    from oakley_grocery import db
     db.save_preference("Milk", 12345, "Pauls Full Cream 2L")
 
     assert db.get_preference("milk") is not None
@@ -63,7 +80,6 @@ def test_save_preference_case_insensitive():
 
 
 def test_delete_preference():
-    from oakley_grocery import db
     db.save_preference("milk", 12345, "Pauls Full Cream 2L")
     assert db.delete_preference("milk") is True
     assert db.get_preference("milk") is None
@@ -71,7 +87,6 @@ def test_delete_preference():
 
 
 def test_search_preferences():
-    from oakley_grocery import db
     db.save_preference("full cream milk", 12345, "Pauls Full Cream 2L")
     db.save_preference("skim milk", 12346, "Pauls Skim Milk 2L")
     db.save_preference("bread", 12347, "Tip Top White")
@@ -81,7 +96,6 @@ def test_search_preferences():
 
 
 def test_get_all_preferences():
-    from oakley_grocery import db
     db.save_preference("milk", 12345, "Pauls Full Cream 2L")
     db.save_preference("bread", 12346, "Tip Top White")
 
@@ -90,7 +104,6 @@ def test_get_all_preferences():
 
 
 def test_count_preferences():
-    from oakley_grocery import db
     assert db.count_preferences() == 0
     db.save_preference("milk", 12345, "Pauls Full Cream 2L")
     assert db.count_preferences() == 1
@@ -99,7 +112,6 @@ def test_count_preferences():
 # ─── Lists ───────────────────────────────────────────────────────────────────
 
 def test_create_list():
-    from oakley_grocery import db
     list_id = db.create_list("Weekly Shop")
     assert list_id > 0
 
@@ -109,7 +121,6 @@ def test_create_list():
 
 
 def test_get_lists():
-    from oakley_grocery import db
     db.create_list("List 1")
     db.create_list("List 2")
 
@@ -118,7 +129,6 @@ def test_get_lists():
 
 
 def test_get_lists_by_status():
-    from oakley_grocery import db
     id1 = db.create_list("Active")
     id2 = db.create_list("Purchased")
     db.update_list_status(id2, "purchased")
@@ -128,8 +138,25 @@ def test_get_lists_by_status():
     assert active[0]["name"] == "Active"
 
 
+def test_get_list_summaries():
+    list_id = db.create_list("Weekly Shop")
+    db.create_list("Empty")
+    item_id = db.add_list_item(list_id, "milk", quantity=2)
+    db.add_list_item(list_id, "bread")
+    db.update_list_item(item_id, resolved=1, price=4.50)
+
+    summaries = {s["name"]: s for s in db.get_list_summaries()}
+    assert summaries["Weekly Shop"]["item_count"] == 2
+    assert summaries["Weekly Shop"]["resolved_count"] == 1
+    assert summaries["Weekly Shop"]["est_total"] == 9.00
+    assert summaries["Empty"]["item_count"] == 0
+    assert summaries["Empty"]["est_total"] == 0
+
+    active = db.get_list_summaries(status="active")
+    assert len(active) == 2
+
+
 def test_update_list_status():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     db.update_list_status(list_id, "purchased", total_estimate=85.50)
 
@@ -139,14 +166,12 @@ def test_update_list_status():
 
 
 def test_delete_list():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     assert db.delete_list(list_id) is True
     assert db.get_list(list_id) is None
 
 
 def test_count_lists():
-    from oakley_grocery import db
     assert db.count_lists() == 0
     db.create_list("Test")
     assert db.count_lists() == 1
@@ -156,7 +181,6 @@ def test_count_lists():
 # ─── List Items ──────────────────────────────────────────────────────────────
 
 def test_add_list_item():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     item_id = db.add_list_item(list_id, "milk", 2)
     assert item_id > 0
@@ -168,7 +192,6 @@ def test_add_list_item():
 
 
 def test_add_list_item_merge_duplicates():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     db.add_list_item(list_id, "milk", 1)
     db.add_list_item(list_id, "milk", 2)
@@ -179,7 +202,6 @@ def test_add_list_item_merge_duplicates():
 
 
 def test_add_list_item_case_insensitive():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     db.add_list_item(list_id, "Milk", 1)
     db.add_list_item(list_id, "MILK", 2)
@@ -190,7 +212,6 @@ def test_add_list_item_case_insensitive():
 
 
 def test_update_list_item():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     item_id = db.add_list_item(list_id, "milk")
 
@@ -204,7 +225,6 @@ def test_update_list_item():
 
 
 def test_remove_list_item():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     db.add_list_item(list_id, "milk")
     db.add_list_item(list_id, "bread")
@@ -216,7 +236,6 @@ def test_remove_list_item():
 
 
 def test_remove_list_item_not_found():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     assert db.remove_list_item(list_id, "nonexistent") is False
 
@@ -224,7 +243,6 @@ def test_remove_list_item_not_found():
 # ─── Orders ──────────────────────────────────────────────────────────────────
 
 def test_create_order():
-    from oakley_grocery import db
     list_id = db.create_list("Test")
     order_id = db.create_order(list_id, 85.0, 92.30, 10)
     assert order_id > 0
@@ -235,7 +253,6 @@ def test_create_order():
 
 
 def test_add_order_item():
-    from oakley_grocery import db
     order_id = db.create_order(None, None, 50.0, 3)
     item_id = db.add_order_item(order_id, "milk", 12345, "Pauls 2L", "Pauls", 1, 4.50)
     assert item_id > 0
@@ -245,8 +262,20 @@ def test_add_order_item():
     assert items[0]["generic_name"] == "milk"
 
 
+def test_add_order_items_bulk():
+    order_id = db.create_order(None, 20.0, 22.50, 2)
+    count = db.add_order_items(order_id, [
+        ("milk", 12345, "Pauls Full Cream 2L", "Pauls", 2, 4.50, 0),
+        ("bread", 12346, "Tip Top White", "Tip Top", 1, 3.80, 1),
+    ])
+    assert count == 2
+
+    items = db.get_order_items(order_id)
+    assert len(items) == 2
+    assert items[1]["on_special"] == 1
+
+
 def test_get_orders():
-    from oakley_grocery import db
     db.create_order(None, None, 50.0, 3)
     db.create_order(None, None, 75.0, 5)
 
@@ -255,7 +284,6 @@ def test_get_orders():
 
 
 def test_count_orders():
-    from oakley_grocery import db
     assert db.count_orders() == 0
     db.create_order(None, None, 50.0, 3)
     assert db.count_orders() == 1
@@ -264,13 +292,20 @@ def test_count_orders():
 # ─── Price History ───────────────────────────────────────────────────────────
 
 def test_record_price():
-    from oakley_grocery import db
     row_id = db.record_price(12345, "Pauls 2L", 4.50)
     assert row_id > 0
 
 
+def test_record_prices_bulk():
+    count = db.record_prices([
+        (12345, "Pauls Full Cream 2L", 4.50, 0),
+        (12346, "Tip Top White", 3.80, 1),
+    ])
+    assert count == 2
+    assert len(db.get_price_history(stockcode=12345)) == 1
+
+
 def test_get_price_history():
-    from oakley_grocery import db
     db.record_price(12345, "Pauls 2L", 4.50)
     db.record_price(12345, "Pauls 2L", 4.75, on_special=True)
     db.record_price(12346, "Tip Top White", 3.50)
@@ -285,7 +320,6 @@ def test_get_price_history():
 # ─── Frequent Items ─────────────────────────────────────────────────────────
 
 def test_get_frequent_items():
-    from oakley_grocery import db
 
     # Create 4 orders, each with milk
     for i in range(4):
@@ -306,7 +340,6 @@ def test_get_frequent_items():
 # ─── Spending Stats ──────────────────────────────────────────────────────────
 
 def test_get_spending_stats():
-    from oakley_grocery import db
     db.create_order(None, None, 50.0, 3)
     db.create_order(None, None, 75.0, 5)
 
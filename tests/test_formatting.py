@@ -1,27 +1,24 @@
 """Tests for common/formatting.py"""
 
 import pytest
+from oakley_grocery.common.formatting import format_price, format_price_change, format_section_header, format_list_item, format_shopping_list, truncate_for_telegram, now_aest, format_datetime_aest, format_danmurphys_price
 
 
 def test_format_price_normal():
-    from oakley_grocery.common.formatting import format_price
     assert format_price(4.50) == "$4.50"
     assert format_price(0.99) == "$0.99"
     assert format_price(123.0) == "$123.00"
 
 
 def test_format_price_none():
-    from oakley_grocery.common.formatting import format_price
     assert format_price(None) == "N/A"
 
 
 def test_format_price_zero():
-    from oakley_grocery.common.formatting import format_price
     assert format_price(0) == "$0.00"
 
 
 def test_format_price_change_decrease():
-    from oakley_grocery.common.formatting import format_price_change
     result = format_price_change(4.50, 5.00)
     assert "$4.50" in result
     assert "$5.00" in result
@@ -29,25 +26,21 @@ def test_format_price_change_decrease():
 
 
 def test_format_price_change_increase():
-    from oakley_grocery.common.formatting import format_price_change
     result = format_price_change(5.50, 5.00)
     assert "+10%" in result
 
 
 def test_format_section_header():
-    from oakley_grocery.common.formatting import format_section_header
     assert format_section_header("Test") == "**Test**"
 
 
 def test_format_list_item():
-    from oakley_grocery.common.formatting import format_list_item
     assert format_list_item("milk") == "- milk"
     assert format_list_item("milk", indent=1) == "  - milk"
     assert format_list_item("milk", indent=2) == "    - milk"
 
 
 def test_format_shopping_list_basic():
-    from oakley_grocery.common.formatting import format_shopping_list
     items = [
         {"generic_name": "milk", "quantity": 1, "price": 4.50, "checked": 0},
         {"generic_name": "bread", "quantity": 2, "price": 3.00, "checked": 1},
@@ -61,7 +54,6 @@ def test_format_shopping_list_basic():
 
 
 def test_format_shopping_list_with_product_name():
-    from oakley_grocery.common.formatting import format_shopping_list
     items = [
         {"generic_name": "milk", "product_name": "Pauls Full Cream 2L", "quantity": 1, "price": 4.50, "checked": 0},
     ]
@@ -70,7 +62,6 @@ def test_format_shopping_list_with_product_name():
 
 
 def test_format_shopping_list_on_special():
-    from oakley_grocery.common.formatting import format_shopping_list
     items = [
         {"generic_name": "yoghurt", "quantity": 1, "price": 3.00, "checked": 0, "on_special": True},
     ]
@@ -79,7 +70,6 @@ def test_format_shopping_list_on_special():
 
 
 def test_format_shopping_list_no_prices():
-    from oakley_grocery.common.formatting import format_shopping_list
     items = [
         {"generic_name": "milk", "quantity": 1, "checked": 0},
     ]
@@ -89,13 +79,11 @@ def test_format_shopping_list_no_prices():
 
 
 def test_truncate_for_telegram_short():
-    from oakley_grocery.common.formatting import truncate_for_telegram
     text = "Short text"
     assert truncate_for_telegram(text) == text
 
 
 def test_truncate_for_telegram_long():
-    from oakley_grocery.common.formatting import truncate_for_telegram
     text = "A" * 5000
     result = truncate_for_telegram(text, max_length=100)
     assert len(result) <= 100
@@ -103,13 +91,11 @@ def test_truncate_for_telegram_long():
 
 
 def test_now_aest():
-    from oakley_grocery.common.formatting import now_aest
     dt = now_aest()
     assert dt.tzinfo is not None
 
 
 def test_format_datetime_aest():
-    from oakley_grocery.common.formatting import format_datetime_aest
     result = format_datetime_aest()
     assert "AEST" in result
 
@@ -118,7 +104,6 @@ def test_format_datetime_aest():
 
 
 def test_format_danmurphys_price_all_tiers():
-    from oakley_grocery.common.formatting import format_danmurphys_price
     product = {"price": 19.99, "six_price": 17.99, "case_price": 107.70}
     result = format_danmurphys_price(product)
     assert "$19.99 ea" in result
@@ -127,7 +112,6 @@ def test_format_danmurphys_price_all_tiers():
 
 
 def test_format_danmurphys_price_single_only():
-    from oakley_grocery.common.formatting import format_danmurphys_price
     product = {"price": 29.99}
     result = format_danmurphys_price(product)
     assert "$29.99 ea" in result
@@ -135,7 +119,6 @@ def test_format_danmurphys_price_single_only():
 
 
 def test_format_danmurphys_price_same_single_and_six():
-    from oakley_grocery.common.formatting import format_danmurphys_price
     product = {"price": 19.99, "six_price": 19.99}
     result = format_danmurphys_price(product)
     assert "$19.99 ea" in result
@@ -143,12 +126,10 @@ def test_format_danmurphys_price_same_single_and_six():
 
 
 def test_format_danmurphys_price_no_prices():
-    from oakley_grocery.common.formatting import format_danmurphys_price
     product = {}
     assert format_danmurphys_price(product) == "N/A"
 
 
 def test_format_danmurphys_price_none_values():
-    from oakley_grocery.common.formatting import format_danmurphys_price
     product = {"price": None, "six_price": None, "case_price": None}
     assert format_danmurphys_price(product) == "N/A"
@@ -2,66 +2,91 @@
 
 import pytest
 from unittest.mock import patch
-
-
-@pytest.fixture(autouse=True)
-def temp_db(tmp_path, monkeypatch):
-    """Use a temporary database for each test."""
-    import oakley_grocery.common.config as cfg
+import oakley_grocery.common.config as cfg
+import oakley_grocery.db as db_mod
+import oakley_grocery.resolver as resolver_mod
+from oakley_grocery.lists import _parse_item_string, _parse_items_batch, create_list, add_items, remove_items, get_list, mark_purchased
+from oakley_grocery import db
+
+
+# One DELETE per table, one commit — resets state without re-running DDL
+RESET_SQL = """
+    BEGIN;
+    DELETE FROM list_items; DELETE FROM order_items;
+    DELETE FROM orders; DELETE FROM lists;
+    DELETE FROM preferences; DELETE FROM price_history;
+    COMMIT;
+"""
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Build one database for the module; tests share it and reset between."""
+    tmp_path = tmp_path_factory.mktemp("lists-db")
     cfg.DATA_DIR = tmp_path
     cfg.CACHE_DIR = tmp_path / "cache"
-    cfg.DB_PATH = tmp_path / "grocery.db"
+    cfg.DB_PATH = ":memory:"  # semantics only — no fsync, no file
     cfg.CONFIG_PATH = tmp_path / "config.json"
     cfg.Config.data_dir = cfg.DATA_DIR
     cfg.Config.cache_dir = cfg.CACHE_DIR
     cfg.Config.db_path = cfg.DB_PATH
     cfg.Config.config_path = cfg.CONFIG_PATH
 
-    import oakley_grocery.db as db_mod
     db_mod._conn = None
     yield tmp_path
+    if db_mod._conn is not None:
+        db_mod._conn.close()
     db_mod._conn = None
 
 
+@pytest.fixture(autouse=True)
+def reset_db(temp_db):
+    """Empty every table after each test — schema setup runs once per module."""
+    yield
+    db_mod._get_conn().executescript(RESET_SQL)
+    db_mod._get_preference_cached.cache_clear()
+    resolver_mod._resolve_cached.cache_clear()  # no stale hits across tests
+
+
 # ─── Parse Item String ──────────────────────────────────────────────────────
 
 def test_parse_item_string_simple():
-    from oakley_grocery.lists import _parse_item_string
     assert _parse_item_string("milk") == ("milk", 1)
 
 
 def test_parse_item_string_with_quantity():
-    from oakley_grocery.lists import _parse_item_string
     assert _parse_item_string("2 milk") == ("milk", 2)
 
 
 def test_parse_item_string_trailing_quantity():
-    from oakley_grocery.lists import _parse_item_string
     assert _parse_item_string("milk x3") == ("milk", 3)
     assert _parse_item_string("milk x 3") == ("milk", 3)
 
 
 def test_parse_item_string_no_quantity_word():
-    from oakley_grocery.lists import _parse_item_string
     assert _parse_item_string("full cream milk") == ("full cream milk", 1)
 
 
 def test_parse_item_string_case_insensitive():
-    from oakley_grocery.lists import _parse_item_string
     name, qty = _parse_item_string("MILK")
     assert name == "milk"
 
 
 def test_parse_item_string_strips_whitespace():
-    from oakley_grocery.lists import _parse_item_string
     name, qty = _parse_item_string("  milk  ")
     assert name == "milk"
 
 
+def test_parse_items_batch_matches_single():
+    # A bare-numeric line must stay its own item, not donate its digits
+    # to the next line as a quantity
+    items = ["3", "milk", "2 x 4 timber", "bread x2"]
+    assert _parse_items_batch(items) == [_parse_item_string(s) for s in items]
+
+
 # ─── Create List ─────────────────────────────────────────────────────────────
 
 def test_create_list_empty():
-    from oakley_grocery.lists import create_list
     result = create_list("Test")
     assert result["list_id"] > 0
     assert result["name"] == "Test"
@@ -69,7 +94,6 @@ def test_create_list_empty():
 
 
 def test_create_list_with_items():
-    from oakley_grocery.lists import create_list
     result = create_list("Test", ["milk", "bread", "2 eggs"])
     assert result["item_count"] == 3
 
@@ -77,7 +101,6 @@ def test_create_list_with_items():
 # ─── Add Items ───────────────────────────────────────────────────────────────
 
 def test_add_items():
-    from oakley_grocery.lists import create_list, add_items
     result = create_list("Test")
     add_result = add_items(result["list_id"], ["milk", "bread"])
     assert add_result["added"] == 2
@@ -85,7 +108,6 @@ def test_add_items():
 
 
 def test_add_items_merge_duplicates():
-    from oakley_grocery.lists import create_list, add_items
     result = create_list("Test", ["milk"])
     add_result = add_items(result["list_id"], ["milk", "bread"])
     assert add_result["added"] == 1
@@ -93,14 +115,11 @@ def test_add_items_merge_duplicates():
 
 
 def test_add_items_list_not_found():
-    from oakley_grocery.lists import add_items
     with pytest.raises(ValueError, match="not found"):
         add_items(999, ["milk"])
 
 
 def test_add_items_inactive_list():
-    from oakley_grocery.lists import create_list, add_items
-    from oakley_grocery import db
     result = create_list("Test")
     db.update_list_status(result["list_id"], "purchased")
     with pytest.raises(ValueError, match="not active"):
@@ -110,7 +129,6 @@ def test_add_items_inactive_list():
 # ─── Remove Items ────────────────────────────────────────────────────────────
 
 def test_remove_items():
-    from oakley_grocery.lists import create_list, remove_items
     result = create_list("Test", ["milk", "bread", "eggs"])
     remove_result = remove_items(result["list_id"], ["milk", "eggs"])
     assert remove_result["removed"] == 2
@@ -118,7 +136,6 @@ def test_remove_items():
 
 
 def test_remove_items_not_found():
-    from oakley_grocery.lists import create_list, remove_items
     result = create_list("Test", ["milk"])
     remove_result = remove_items(result["list_id"], ["bread"])
     assert remove_result["removed"] == 0
@@ -128,7 +145,6 @@ def test_remove_items_not_found():
 # ─── Get List ────────────────────────────────────────────────────────────────
 
 def test_get_list():
-    from oakley_grocery.lists import create_list, get_list
     result = create_list("Test", ["milk", "bread"])
     data = get_list(result["list_id"])
     assert data["list"]["name"] == "Test"
@@ -138,7 +154,6 @@ def test_get_list():
 
 
 def test_get_list_not_found():
-    from oakley_grocery.lists import get_list
     with pytest.raises(ValueError, match="not found"):
         get_list(999)
 
@@ -146,9 +161,6 @@ def test_get_list_not_found():
 # ─── Mark Purchased ─────────────────────────────────────────────────────────
 
 def test_mark_purchased():
-    from oakley_grocery.lists import create_list, mark_purchased
-    from oakley_grocery import db
-
     result = create_list("Test", ["milk", "bread"])
     list_id = result["list_id"]
 
@@ -171,6 +183,5 @@ def test_mark_purchased():
 
 
 def test_mark_purchased_not_found():
-    from oakley_grocery.lists import mark_purchased
     with pytest.raises(ValueError, match="not found"):
         mark_purchased(999)
@@ -1,49 +1,69 @@
 """Tests for memory.py — weekly shop intelligence."""
 
 import pytest
-
-
-@pytest.fixture(autouse=True)
-def temp_db(tmp_path, monkeypatch):
-    """Use a temporary database for each test."""
-    import oakley_grocery.common.config as cfg
+import oakley_grocery.common.config as cfg
+import oakley_grocery.db as db_mod
+from oakley_grocery import db
+from oakley_grocery.memory import build_usual, suggest_additions, get_purchase_frequency, get_spending_summary
+
+
+# One DELETE per table, one commit — resets state without re-running DDL
+RESET_SQL = """
+    BEGIN;
+    DELETE FROM list_items; DELETE FROM order_items;
+    DELETE FROM orders; DELETE FROM lists;
+    DELETE FROM preferences; DELETE FROM price_history;
+    COMMIT;
+"""
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Build one database for the module; tests share it and reset between."""
+    tmp_path = tmp_path_factory.mktemp("memory-db")
     cfg.DATA_DIR = tmp_path
     cfg.CACHE_DIR = tmp_path / "cache"
-    cfg.DB_PATH = tmp_path / "grocery.db"
+    cfg.DB_PATH = ":memory:"  # semantics only — no fsync, no file
     cfg.CONFIG_PATH = tmp_path / "config.json"
     cfg.Config.data_dir = cfg.DATA_DIR
     cfg.Config.cache_dir = cfg.CACHE_DIR
     cfg.Config.db_path = cfg.DB_PATH
     cfg.Config.config_path = cfg.CONFIG_PATH
 
-    import oakley_grocery.db as db_mod
     db_mod._conn = None
     yield tmp_path
+    if db_mod._conn is not None:
+        db_mod._conn.close()
     db_mod._conn = None
 
 
+@pytest.fixture(autouse=True)
+def reset_db(temp_db):
+    """Empty every table after each test — schema setup runs once per module."""
+    yield
+    db_mod._get_conn().executescript(RESET_SQL)
+    db_mod._get_preference_cached.cache_clear()
+
+
 def _create_orders_with_items(n_orders, items_per_order):
     """Helper: create n orders, each with the given items."""
-    from oakley_grocery import db
-    for i in range(n_orders):
-        order_id = db.create_order(None, None, 50.0 + i, len(items_per_order))
-        for generic, stockcode, product, brand, price in items_per_order:
-            db.add_order_item(order_id, generic, stockcode, product, brand, 1, price)
+    rows = [(generic, stockcode, product, brand, 1, price, 0)
+            for generic, stockcode, product, brand, price in items_per_order]
+    with db.transaction():
+        for i in range(n_orders):
+            order_id = db.create_order(None, None, 50.0 + i, len(items_per_order))
+            db.add_order_items(order_id, rows)
 
 
 # ─── Build Usual ─────────────────────────────────────────────────────────────
 
 def test_build_usual_not_enough_orders():
-    from oakley_grocery.memory import build_usual
     items = build_usual()
     assert items == []
 
 
 def test_build_usual_returns_frequent_items():
-    from oakley_grocery.memory import build_usual
-
     # Create 5 orders, each with milk. Bread only in 2.
-    from oakley_grocery import db
     for i in range(5):
         order_id = db.create_order(None, None, 50.0, 2)
         db.add_order_item(order_id, "milk", 12345, "Pauls 2L", "Pauls", 1, 4.50)
@@ -56,9 +76,6 @@ def test_build_usual_returns_frequent_items():
 
 
 def test_build_usual_with_exclude():
-    from oakley_grocery.memory import build_usual
-    from oakley_grocery import db
-
     for i in range(4):
         order_id = db.create_order(None, None, 50.0, 2)
         db.add_order_item(order_id, "milk", 12345, "Pauls 2L", "Pauls", 1, 4.50)
@@ -73,9 +90,6 @@ def test_build_usual_with_exclude():
 # ─── Suggest Additions ───────────────────────────────────────────────────────
 
 def test_suggest_additions():
-    from oakley_grocery.memory import suggest_additions
-    from oakley_grocery import db
-
     # Create history with milk and bread frequent
     for i in range(4):
         order_id = db.create_order(None, None, 50.0, 2)
@@ -95,9 +109,6 @@ def test_suggest_additions():
 # ─── Purchase Frequency ─────────────────────────────────────────────────────
 
 def test_get_purchase_frequency():
-    from oakley_grocery.memory import get_purchase_frequency
-    from oakley_grocery import db
-
     for i in range(3):
         order_id = db.create_order(None, None, 50.0, 1)
         db.add_order_item(order_id, "milk", 12345, "Pauls 2L", "Pauls", 1, 4.50)
@@ -109,7 +120,6 @@ def test_get_purchase_frequency():
 
 
 def test_get_purchase_frequency_no_history():
-    from oakley_grocery.memory import get_purchase_frequency
     freq = get_purchase_frequency("nonexistent")
     assert freq["total_purchases"] == 0
 
@@ -117,9 +127,6 @@ def test_get_purchase_frequency_no_history():
 # ─── Spending Summary ───────────────────────────────────────────────────────
 
 def test_get_spending_summary():
-    from oakley_grocery.memory import get_spending_summary
-    from oakley_grocery import db
-
     order1 = db.create_order(None, None, 50.0, 2)
     db.add_order_item(order1, "milk", 12345, "Pauls 2L", "Pauls", 1, 4.50)
     db.add_order_item(order1, "bread", 12346, "Tip Top", "Tip Top", 1, 3.50)
@@ -134,7 +141,6 @@ def test_get_spending_summary():
 
 
 def test_get_spending_summary_empty():
-    from oakley_grocery.memory import get_spending_summary
     summary = get_spending_summary(period_days=30)
     assert summary["order_count"] == 0
     assert summary["total_spent"] == 0
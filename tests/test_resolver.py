@@ -2,67 +2,85 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-
-
-@pytest.fixture(autouse=True)
-def temp_db(tmp_path, monkeypatch):
-    """Use a temporary database for each test."""
-    import oakley_grocery.common.config as cfg
+import oakley_grocery.common.config as cfg
+import oakley_grocery.db as db_mod
+import oakley_grocery.resolver as resolver_mod
+from oakley_grocery.resolver import _tokenize, _jaccard, _calculate_relevance, resolve_item, learn_preference, resolve_list
+from oakley_grocery import db
+
+
+# One DELETE per table, one commit — resets state without re-running DDL
+RESET_SQL = """
+    BEGIN;
+    DELETE FROM list_items; DELETE FROM order_items;
+    DELETE FROM orders; DELETE FROM lists;
+    DELETE FROM preferences; DELETE FROM price_history;
+    COMMIT;
+"""
+
+
+@pytest.fixture(scope="module")
+def temp_db(tmp_path_factory):
+    """Build one database for the module; tests share it and reset between."""
+    tmp_path = tmp_path_factory.mktemp("resolver-db")
     cfg.DATA_DIR = tmp_path
     cfg.CACHE_DIR = tmp_path / "cache"
-    cfg.DB_PATH = tmp_path / "grocery.db"
+    cfg.DB_PATH = ":memory:"  # semantics only — no fsync, no file
     cfg.CONFIG_PATH = tmp_path / "config.json"
     cfg.Config.data_dir = cfg.DATA_DIR
     cfg.Config.cache_dir = cfg.CACHE_DIR
     cfg.Config.db_path = cfg.DB_PATH
     cfg.Config.config_path = cfg.CONFIG_PATH
 
-    import oakley_grocery.db as db_mod
     db_mod._conn = None
     yield tmp_path
+    if db_mod._conn is not None:
+        db_mod._conn.close()
     db_mod._conn = None
 
 
+@pytest.fixture(autouse=True)
+def reset_db(temp_db):
+    """Empty every table after each test — schema setup runs once per module."""
+    yield
+    db_mod._get_conn().executescript(RESET_SQL)
+    db_mod._get_preference_cached.cache_clear()
+    resolver_mod._resolve_cached.cache_clear()  # no stale hits across tests
+
+
 # ─── Tokenization & Scoring ─────────────────────────────────────────────────
 
 def test_tokenize():
-    from oakley_grocery.resolver import _tokenize
     assert _tokenize("full cream milk") == {"full", "cream", "milk"}
     assert _tokenize("") == set()
     assert _tokenize("MILK") == {"milk"}
 
 
 def test_jaccard_identical():
-    from oakley_grocery.resolver import _jaccard
     assert _jaccard({"a", "b"}, {"a", "b"}) == 1.0
 
 
 def test_jaccard_disjoint():
-    from oakley_grocery.resolver import _jaccard
     assert _jaccard({"a", "b"}, {"c", "d"}) == 0.0
 
 
 def test_jaccard_partial():
-    from oakley_grocery.resolver import _jaccard
     result = _jaccard({"a", "b", "c"}, {"a", "b", "d"})
     assert abs(result - 0.5) < 0.01  # 2/4
 
 
 def test_jaccard_empty():
-    from oakley_grocery.resolver import _jaccard
     assert _jaccard(set(), {"a"}) == 0.0
     assert _jaccard(set(), set()) == 0.0
 
 
 def test_calculate_relevance_name_match():
-    from oakley_grocery.resolver import _calculate_relevance
     product = {"name": "Full Cream Milk 2L", "available": True}
     score = _calculate_relevance(product, "full cream milk")
     assert score > 0.2  # Name overlap should contribute
 
 
 def test_calculate_relevance_brand_match():
-    from oakley_grocery.resolver import _calculate_relevance
     product = {"name": "Full Cream Milk", "brand": "Pauls", "available": True}
     score_with_brand = _calculate_relevance(product, "milk", prefer_brand="Pauls")
     score_without_brand = _calculate_relevance(product, "milk")
@@ -70,7 +88,6 @@ def test_calculate_relevance_brand_match():
 
 
 def test_calculate_relevance_size_match():
-    from oakley_grocery.resolver import _calculate_relevance
     product = {"name": "Milk", "package_size": "2L", "available": True}
     score_with_size = _calculate_relevance(product, "milk", prefer_size="2L")
     score_without_size = _calculate_relevance(product, "milk")
@@ -78,7 +95,6 @@ def test_calculate_relevance_size_match():
 
 
 def test_calculate_relevance_on_special():
-    from oakley_grocery.resolver import _calculate_relevance
     product_special = {"name": "Milk", "on_special": True, "available": True}
     product_normal = {"name": "Milk", "on_special": False, "available": True}
     score_special = _calculate_relevance(product_special, "milk")
@@ -87,7 +103,6 @@ def test_calculate_relevance_on_special():
 
 
 def test_calculate_relevance_unavailable_penalty():
-    from oakley_grocery.resolver import _calculate_relevance
     product_available = {"name": "Milk", "available": True}
     product_unavailable = {"name": "Milk", "available": False}
     score_available = _calculate_relevance(product_available, "milk")
@@ -98,9 +113,6 @@ def test_calculate_relevance_unavailable_penalty():
 # ─── Preference Resolution ──────────────────────────────────────────────────
 
 def test_resolve_from_preference():
-    from oakley_grocery import db
-    from oakley_grocery.resolver import resolve_item
-
     db.save_preference("milk", 12345, "Pauls Full Cream 2L", "Pauls", "2L", 4.50)
 
     result = resolve_item("milk")
@@ -110,9 +122,6 @@ def test_resolve_from_preference():
 
 
 def test_resolve_from_preference_case_insensitive():
-    from oakley_grocery import db
-    from oakley_grocery.resolver import resolve_item
-
     db.save_preference("milk", 12345, "Pauls Full Cream 2L")
 
     result = resolve_item("MILK")
@@ -121,9 +130,6 @@ def test_resolve_from_preference_case_insensitive():
 
 
 def test_resolve_fuzzy_preference():
-    from oakley_grocery import db
-    from oakley_grocery.resolver import resolve_item
-
     db.save_preference("full cream milk", 12345, "Pauls Full Cream 2L")
 
     # "cream milk" should fuzzy-match "full cream milk"
@@ -134,14 +140,22 @@ def test_resolve_fuzzy_preference():
 
 # ─── Search Resolution ──────────────────────────────────────────────────────
 
+# Shared search payloads — scoring never mutates candidates, so every
+# test can hand the mock the same tuples
+_SEARCH_MILK = (
+    {"stockcode": 100, "name": "Full Cream Milk", "brand": "Pauls", "price": 4.50, "available": True, "on_special": True, "package_size": "2L"},
+    {"stockcode": 101, "name": "Chocolate Flavoured Drink 600mL", "brand": "Oak", "price": 3.00, "available": True, "on_special": False, "package_size": "600mL"},
+)
+# Two very similar products — should need disambiguation
+_SEARCH_AMBIGUOUS = (
+    {"stockcode": 100, "name": "Milk 2L", "brand": "Brand A", "price": 4.50, "available": True, "on_special": False, "package_size": "2L"},
+    {"stockcode": 101, "name": "Milk 2L", "brand": "Brand B", "price": 4.00, "available": True, "on_special": False, "package_size": "2L"},
+)
+
+
 @patch("oakley_grocery.resolver.woolworths.search_products")
 def test_resolve_from_search_auto(mock_search):
-    from oakley_grocery.resolver import resolve_item
-
-    mock_search.return_value = [
-        {"stockcode": 100, "name": "Full Cream Milk", "brand": "Pauls", "price": 4.50, "available": True, "on_special": True, "package_size": "2L"},
-        {"stockcode": 101, "name": "Chocolate Flavoured Drink 600mL", "brand": "Oak", "price": 3.00, "available": True, "on_special": False, "package_size": "600mL"},
-    ]
+    mock_search.return_value = _SEARCH_MILK
 
     result = resolve_item("full cream milk")
     assert result["resolved"] is True
@@ -151,13 +165,7 @@ def test_resolve_from_search_auto(mock_search):
 
 @patch("oakley_grocery.resolver.woolworths.search_products")
 def test_resolve_from_search_disambiguation(mock_search):
-    from oakley_grocery.resolver import resolve_item
-
-    # Two very similar products — should need disambiguation
-    mock_search.return_value = [
-        {"stockcode": 100, "name": "Milk 2L", "brand": "Brand A", "price": 4.50, "available": True, "on_special": False, "package_size": "2L"},
-        {"stockcode": 101, "name": "Milk 2L", "brand": "Brand B", "price": 4.00, "available": True, "on_special": False, "package_size": "2L"},
-    ]
+    mock_search.return_value = _SEARCH_AMBIGUOUS
 
     result = resolve_item("milk 2l")
     # Both should be in candidates
@@ -166,8 +174,6 @@ def test_resolve_from_search_disambiguation(mock_search):
 
 @patch("oakley_grocery.resolver.woolworths.search_products")
 def test_resolve_search_failure(mock_search):
-    from oakley_grocery.resolver import resolve_item
-
     mock_search.side_effect = RuntimeError("API down")
 
     result = resolve_item("milk")
@@ -177,8 +183,6 @@ def test_resolve_search_failure(mock_search):
 
 @patch("oakley_grocery.resolver.woolworths.search_products")
 def test_resolve_no_results(mock_search):
-    from oakley_grocery.resolver import resolve_item
-
     mock_search.return_value = []
 
     result = resolve_item("nonexistent product")
@@ -189,9 +193,6 @@ def test_resolve_no_results(mock_search):
 # ─── Learn Preference ───────────────────────────────────────────────────────
 
 def test_learn_preference():
-    from oakley_grocery.resolver import learn_preference
-    from oakley_grocery import db
-
     pref_id = learn_preference("milk", 12345, "Pauls Full Cream 2L", "Pauls", "2L", 4.50)
     assert pref_id > 0
 
@@ -202,9 +203,6 @@ def test_learn_preference():
 # ─── Batch Resolution ───────────────────────────────────────────────────────
 
 def test_resolve_list():
-    from oakley_grocery import db
-    from oakley_grocery.resolver import resolve_list
-
     db.save_preference("milk", 12345, "Pauls 2L")
     db.save_preference("bread", 12346, "Tip Top White")
 
@@ -1,11 +1,10 @@
 """Tests for woolworths.py — product parsing and search helpers."""
 
 import pytest
+from oakley_grocery.woolworths import _parse_product
 
 
 def test_parse_product_basic():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 12345,
         "Name": "Pauls Full Cream Milk",
@@ -35,8 +34,6 @@ def test_parse_product_basic():
 
 
 def test_parse_product_on_special():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 12345,
         "Name": "Pauls Milk",
@@ -55,8 +52,6 @@ def test_parse_product_on_special():
 
 
 def test_parse_product_unavailable():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 99999,
         "Name": "Out Of Stock Item",
@@ -69,8 +64,6 @@ def test_parse_product_unavailable():
 
 
 def test_parse_product_missing_fields():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {"Stockcode": 11111}
     result = _parse_product(raw)
     assert result["stockcode"] == 11111
@@ -81,8 +74,6 @@ def test_parse_product_missing_fields():
 
 
 def test_parse_product_instore_price():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 22222,
         "Name": "Instore Item",
@@ -95,8 +86,6 @@ def test_parse_product_instore_price():
 
 
 def test_parse_product_display_name_fallback():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 33333,
         "DisplayName": "Display Name",
@@ -107,8 +96,6 @@ def test_parse_product_display_name_fallback():
 
 
 def test_parse_product_instore_special():
-    from oakley_grocery.woolworths import _parse_product
-
     raw = {
         "Stockcode": 44444,
         "Name": "Instore Special",